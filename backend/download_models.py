@@ -5,7 +5,13 @@ Downloads models locally for offline use.
 
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
+
+# Parallel Rust downloader for the multi-GB snapshots, when installed
+if find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from huggingface_hub import snapshot_download
 import torch
 import logging
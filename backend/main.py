@@ -11,14 +11,21 @@ from contextlib import asynccontextmanager
 import logging
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+# Use the multi-connection Rust downloader for on-demand model downloads when
+# installed. huggingface_hub reads this once at import (pulled in below via
+# transformers) and fails downloads if it is enabled without the package.
+if find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from routes import extract, verify
 from utils.logger import setup_logger, log_error_with_traceback
-from services.ocr_service import initialize_paddleocr
+from services.ocr_service import initialize_paddleocr, warm_up_paddleocr
 from services.trocr_service import initialize_models as initialize_trocr_models
 
 # Configure logging
@@ -42,6 +49,7 @@ async def lifespan(app: FastAPI):
         try:
             ocr = initialize_paddleocr(lang)
             if ocr:
+                warm_up_paddleocr(ocr)
                 initialized_count += 1
                 logger.info(f"[OK] PaddleOCR initialized for {lang}")
             else:
@@ -9,7 +9,6 @@ from typing import Optional, Dict, Any
 import os
 import sys
 import tempfile
-from PIL import Image
 from utils.logger import setup_logger, log_ocr_result, log_field_extraction, log_error_with_traceback
 
 # Add parent directory to path
@@ -17,7 +16,7 @@ backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, backend_dir)
 
 from services.preprocess import preprocess_image
-from services.ocr_service import extract_text_from_image, extract_text_from_pdf
+from services.ocr_service import extract_text_from_bytes, extract_text_from_pdf
 from services.field_mapper import extract_all_fields, normalize_text
 
 logger = setup_logger("extract_route")
@@ -67,7 +66,6 @@ async def extract_fields(
     
     try:
         # Initialize variables
-        image = None
         raw_text = ""
         ocr_confidence = 0.0
         language_detected = "en"
@@ -82,106 +80,93 @@ async def extract_fields(
         
         logger.info(f"Processing file: {file.filename}")
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            
-            # DEBUG: Check file upload
-            logger.info(f"[DEBUG] Received file: {file.filename}")
-            logger.info(f"[DEBUG] File size: {len(content)} bytes")
-            logger.info(f"[DEBUG] Content type: {file.content_type}")
-            
-            if len(content) == 0:
-                logger.error("[ERROR] File content is empty!")
-                return create_error_response(
-                    "File upload failed: file is empty",
-                    {"file_provided": True, "file_size": 0}
-                )
-            
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-            logger.info(f"[DEBUG] Saved temp file to: {tmp_path}")
+        content = await file.read()
         
-        try:
-            # Determine file type
-            file_ext = os.path.splitext(file.filename)[1].lower()
+        # DEBUG: Check file upload
+        logger.info(f"[DEBUG] Received file: {file.filename}")
+        logger.info(f"[DEBUG] File size: {len(content)} bytes")
+        logger.info(f"[DEBUG] Content type: {file.content_type}")
+        
+        if len(content) == 0:
+            logger.error("[ERROR] File content is empty!")
+            return create_error_response(
+                "File upload failed: file is empty",
+                {"file_provided": True, "file_size": 0}
+            )
+        
+        # Determine file type
+        file_ext = os.path.splitext(file.filename)[1].lower()
+        
+        if file_ext == ".pdf":
+            # Handle PDF - pdf2image reads from a path, so only PDFs go through a temp file
+            logger.info("Processing PDF file")
+            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+                tmp_file.write(content)
+                tmp_path = tmp_file.name
+            logger.info(f"[DEBUG] Saved temp file to: {tmp_path}")
             
-            if file_ext == ".pdf":
-                # Handle PDF
-                logger.info("Processing PDF file")
+            try:
                 ocr_result = extract_text_from_pdf(tmp_path)
-                raw_text = ocr_result.get("raw_text", "")
-                ocr_confidence = ocr_result.get("avg_confidence", 0.0)
-                language_detected = ocr_result.get("language_detected", "en")
-                ocr_error = ocr_result.get("error")
-                
-                if ocr_error:
-                    logger.warning(f"PDF extraction error: {ocr_error}")
-                    return create_error_response(
-                        f"Text could not be extracted from PDF: {ocr_error}",
-                        {"file_type": "pdf", "ocr_error": ocr_error}
-                    )
-                
-            else:
-                # Handle image
-                logger.info("Processing image file")
-                try:
-                    image = Image.open(tmp_path)
-                    if image.mode != "RGB":
-                        image = image.convert("RGB")
-                except Exception as e:
-                    log_error_with_traceback(logger, e, "Image opening")
-                    return create_error_response(
-                        f"Failed to open image: {str(e)}",
-                        {"file_type": "image", "error": str(e)}
-                    )
-                
-                # Use PaddleOCR for all documents (handwritten and printed)
-                # PaddleOCR handles multi-line text much better than TrOCR
-                # TrOCR is single-line only and misses most content in forms
-                logger.info(f"[DEBUG] Original image size: {image.size}, mode: {image.mode}")
-                logger.info("[DEBUG] Using PaddleOCR multilingual OCR (best for multi-line documents)")
-                
-                # Pass original image - preprocessing will be done inside OCR service
-                ocr_result = extract_text_from_image(image)
-                raw_text = ocr_result.get("raw_text", "")
-                ocr_confidence = ocr_result.get("avg_confidence", 0.0)
-                language_detected = ocr_result.get("language_detected", "en")
-                ocr_error = ocr_result.get("error")
-                
-                # DEBUG: Print raw OCR text with detailed analysis
-                logger.info("=" * 60)
-                logger.info("=== OCR RAW TEXT START ===")
-                logger.info(f"Raw OCR Text: {repr(raw_text)}")
-                logger.info(f"Text Length: {len(raw_text)}")
-                logger.info(f"Language Detected: {language_detected}")
-                logger.info(f"OCR Confidence: {ocr_confidence:.2f}")
-                logger.info(f"Line Count: {ocr_result.get('line_count', 0)}")
-                logger.info(f"Text Preview (first 500 chars): {raw_text[:500] if raw_text else '(empty)'}")
-                if raw_text:
-                    lines = raw_text.split('\n')
-                    logger.info(f"Number of lines: {len(lines)}")
-                    logger.info(f"First 10 lines: {lines[:10]}")
-                logger.info("=== OCR RAW TEXT END ===")
-                logger.info("=" * 60)
-                
-                if ocr_error:
-                    logger.warning(f"OCR extraction error: {ocr_error}")
-                    return create_error_response(
-                        f"Text could not be extracted: {ocr_error}",
-                        {"file_type": "image", "ocr_error": ocr_error, **debug_info}
-                    )
-                
-                log_ocr_result(logger, len(raw_text), ocr_confidence, language_detected)
-                
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
+            finally:
+                # Clean up temp file
                 try:
                     os.unlink(tmp_path)
                 except Exception:
                     pass
-        
+            
+            raw_text = ocr_result.get("raw_text", "")
+            ocr_confidence = ocr_result.get("avg_confidence", 0.0)
+            language_detected = ocr_result.get("language_detected", "en")
+            ocr_error = ocr_result.get("error")
+            
+            if ocr_error:
+                logger.warning(f"PDF extraction error: {ocr_error}")
+                return create_error_response(
+                    f"Text could not be extracted from PDF: {ocr_error}",
+                    {"file_type": "pdf", "ocr_error": ocr_error}
+                )
+            
+        else:
+            # Handle image
+            logger.info("Processing image file")
+            
+            # Use PaddleOCR for all documents (handwritten and printed)
+            # PaddleOCR handles multi-line text much better than TrOCR
+            # TrOCR is single-line only and misses most content in forms
+            logger.info("[DEBUG] Using PaddleOCR multilingual OCR (best for multi-line documents)")
+            
+            # Pass the uploaded bytes - decoding and resizing happen inside the OCR service
+            ocr_result = extract_text_from_bytes(content)
+            raw_text = ocr_result.get("raw_text", "")
+            ocr_confidence = ocr_result.get("avg_confidence", 0.0)
+            language_detected = ocr_result.get("language_detected", "en")
+            ocr_error = ocr_result.get("error")
+            
+            # DEBUG: Print raw OCR text with detailed analysis
+            logger.info("=" * 60)
+            logger.info("=== OCR RAW TEXT START ===")
+            logger.info(f"Raw OCR Text: {repr(raw_text)}")
+            logger.info(f"Text Length: {len(raw_text)}")
+            logger.info(f"Language Detected: {language_detected}")
+            logger.info(f"OCR Confidence: {ocr_confidence:.2f}")
+            logger.info(f"Line Count: {ocr_result.get('line_count', 0)}")
+            logger.info(f"Text Preview (first 500 chars): {raw_text[:500] if raw_text else '(empty)'}")
+            if raw_text:
+                lines = raw_text.split('\n')
+                logger.info(f"Number of lines: {len(lines)}")
+                logger.info(f"First 10 lines: {lines[:10]}")
+            logger.info("=== OCR RAW TEXT END ===")
+            logger.info("=" * 60)
+            
+            if ocr_error:
+                logger.warning(f"OCR extraction error: {ocr_error}")
+                return create_error_response(
+                    f"Text could not be extracted: {ocr_error}",
+                    {"file_type": "image", "ocr_error": ocr_error, **debug_info}
+                )
+            
+            log_ocr_result(logger, len(raw_text), ocr_confidence, language_detected)
+            
         # Store original raw text for field extraction (extract_all_fields handles normalization internally)
         original_raw_text = raw_text
         
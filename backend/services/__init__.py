@@ -1,3 +1,9 @@
 # Services package
 
+import os
+import sys
 
+# Make the backend directory importable once, so service modules can use `utils.*`
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
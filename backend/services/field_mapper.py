@@ -6,47 +6,613 @@ Extracts: name, age, gender, phone, email, address.
 """
 
 import re
+import logging
+from functools import lru_cache
 from typing import Dict, Optional, List
-import sys
-import os
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
-from utils.language_detector import detect_language
+
+try:
+    import re2  # google-re2: linear-time DFA matching, optional
+except ImportError:
+    re2 = None
 
 logger = setup_logger("field_mapper")
 
+if re2 is not None:
+    _re2_options = re2.Options()
+    _re2_options.log_errors = False
+
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _re2_agrees(text: str) -> bool:
+    """
+    Whether RE2 matches text exactly like stdlib re. RE2's digit, word, space and
+    word-boundary classes are ASCII only (re also matches Devanagari and Arabic-Indic
+    digits and letters), and its $ does not match before a trailing newline.
+    """
+    return text.isascii() and not text.endswith('\n')
+
+
+class _AsciiGatedPattern:
+    """RE2 pattern that hands text RE2 would read differently to its stdlib twin."""
+    
+    __slots__ = ('pattern', 'flags', 're2_pattern', '_re')
+    
+    def __init__(self, re2_pattern, re_pattern: 're.Pattern'):
+        self.pattern = re_pattern.pattern
+        self.flags = re_pattern.flags
+        self.re2_pattern = re2_pattern
+        self._re = re_pattern
+    
+    def _engine(self, string: str):
+        return self.re2_pattern if _re2_agrees(string) else self._re
+    
+    def search(self, string: str, *args):
+        return self._engine(string).search(string, *args)
+    
+    def match(self, string: str, *args):
+        return self._engine(string).match(string, *args)
+    
+    def fullmatch(self, string: str, *args):
+        return self._engine(string).fullmatch(string, *args)
+    
+    def finditer(self, string: str, *args):
+        return self._engine(string).finditer(string, *args)
+    
+    def findall(self, string: str, *args):
+        return self._engine(string).findall(string, *args)
+    
+    def split(self, string: str, *args):
+        return self._engine(string).split(string, *args)
+    
+    def sub(self, repl, string: str, *args):
+        return self._engine(string).sub(repl, string, *args)
+    
+    def subn(self, repl, string: str, *args):
+        return self._engine(string).subn(repl, string, *args)
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with RE2 when it is installed (no catastrophic backtracking
+    on long OCR text), falling back to stdlib re for syntax RE2 does not support
+    such as lookarounds and backreferences. Text RE2 would read differently from
+    re is matched with re (see _re2_agrees), so results are the same either way.
+    """
+    compiled = re.compile(pattern, flags)
+    if re2 is not None:
+        inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return _AsciiGatedPattern(
+                re2.compile(f'(?{inline}){pattern}' if inline else pattern, _re2_options),
+                compiled
+            )
+        except re2.error:
+            logger.debug("RE2 cannot compile %r, using re", pattern)
+    return compiled
+
+
 # Compile regex patterns for speed (compile once, use many times)
 # FIXED: Patterns now handle lowercase/mixed case from OCR errors
 _compiled_patterns = {
     'name': [
         # More flexible: allows lowercase start (OCR might lowercase first letter)
-        re.compile(r'(?:name|full\s+name|applicant\s+name|your\s+name|mame|norme|neme)[:\s]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Age|Gender|Phone|Email|Address|City|State|Country|Date|Birth|Parents|Occupation|Mobile)|$)', re.IGNORECASE | re.MULTILINE),
-        re.compile(r'(?:name|mame|neme)[:\s]+([A-Za-z]\.?\s*[A-Za-z][a-zA-Z]+\s+[A-Za-z][a-zA-Z]+(?:\s+[A-Za-z][a-zA-Z]+)?)', re.IGNORECASE),
+        _compile(r'(?:name|full\s+name|applicant\s+name|your\s+name|mame|norme|neme)[:\s]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Age|Gender|Phone|Email|Address|City|State|Country|Date|Birth|Parents|Occupation|Mobile)|$)', re.IGNORECASE | re.MULTILINE),
+        _compile(r'(?:name|mame|neme)[:\s]+([A-Za-z]\.?\s*[A-Za-z][a-zA-Z]+\s+[A-Za-z][a-zA-Z]+(?:\s+[A-Za-z][a-zA-Z]+)?)', re.IGNORECASE),
     ],
     'phone': [
-        re.compile(r'(?:phone|mobile|tel|contact|ph\.?)[:\s\-]*(?:number)?[:\s\-]*(\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})', re.IGNORECASE),
-        re.compile(r'(\d{7,15})', re.IGNORECASE),
+        _compile(r'(?:phone|mobile|tel|contact|ph\.?)[:\s\-]*(?:number)?[:\s\-]*(\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})', re.IGNORECASE),
+        _compile(r'(\d{7,15})', re.IGNORECASE),
     ],
     'email': [
-        re.compile(r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE),
-        re.compile(r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b', re.IGNORECASE),
+        _compile(r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE),
+        _compile(r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b', re.IGNORECASE),
     ],
     'dob': [
-        re.compile(r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth|date\s+st)[:\s\-\.]+(\d{1,2})[/.\-l](\d{1,2})[/.\-l](\d{2,4})', re.IGNORECASE),
-        re.compile(r'(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4})', re.IGNORECASE),
+        _compile(r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth|date\s+st)[:\s\-\.]+(\d{1,2})[/.\-l](\d{1,2})[/.\-l](\d{2,4})', re.IGNORECASE),
+        _compile(r'(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4})', re.IGNORECASE),
     ],
     'occupation': [
         # More flexible: allows lowercase start
-        re.compile(r'(?:occupation|profession|job|designation|ocupation)[:.\s\-]+([A-Za-z][a-zA-Z\s]+?)(?:\s+(?:Phone|Email|Address|Age|Gender|Mobile|Date|Birth|Mobile|Number|$))', re.IGNORECASE),
+        _compile(r'(?:occupation|profession|job|designation|ocupation)[:.\s\-]+([A-Za-z][a-zA-Z\s]+?)(?:\s+(?:Phone|Email|Address|Age|Gender|Mobile|Date|Birth|Mobile|Number|$))', re.IGNORECASE),
     ],
     'parents': [
         # More flexible: allows lowercase start
-        re.compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\.]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
+        _compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\.]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
     ],
+    'age': [
+        # Explicit labels
+        _compile(r'(?:age|years?\s+old|yrs?\.?)[:\s\-]+(\d{1,3})', re.IGNORECASE),
+        _compile(r'\b(\d{1,3})\s*(?:years?\s+old|yrs?\.?|y\.?o\.?)', re.IGNORECASE),
+
+        # Pattern: Age: 25
+        _compile(r'age[:\s]+(\d{1,3})', re.IGNORECASE),
+    ],
+    'age_dob': [
+        _compile(r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth)[:\s\-]+(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{2,4})', re.IGNORECASE),
+        _compile(r'(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4})', re.IGNORECASE),  # DD/MM/YYYY or MM/DD/YYYY
+        _compile(r'(\d{4})[/.\-](\d{1,2})[/.\-](\d{1,2})', re.IGNORECASE),  # YYYY/MM/DD
+    ],
+    'gender': [
+        # Explicit labels
+        _compile(r'(?:gender|sex)[:\s\-]+(male|female|other|m|f|m\.|f\.)', re.IGNORECASE),
+        _compile(r'(?:gender|sex)[:\s\-]+([MF])', re.IGNORECASE),
+
+        # Standalone mentions
+        _compile(r'\b(male|female|other)\b', re.IGNORECASE),
+        _compile(r'\b([MF])\b', re.IGNORECASE),  # Single letter
+    ],
+    'email_candidates': [
+        # With labels - handle spaces in email (most specific) - capture full email including spaces
+        _compile(r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+(?:\s+[a-zA-Z0-9._%+-]+)*)\s*@\s*([a-zA-Z0-9.-]+)\s*\.\s*([a-zA-Z]{2,})', re.IGNORECASE),
+
+        # Standard email with spaces between parts
+        _compile(r'([a-zA-Z0-9._%+-]+(?:\s+[a-zA-Z0-9._%+-]+)*)\s*@\s*([a-zA-Z0-9.-]+)\s*\.\s*([a-zA-Z]{2,})', re.IGNORECASE),
+
+        # Standard email without spaces (most common)
+        _compile(r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE),
+
+        # Standalone email (no label)
+        _compile(r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b', re.IGNORECASE),
+
+        # Handle common OCR errors in emails
+        _compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.(?:com|net|org|edu|gov|in|co))', re.IGNORECASE),
+    ],
+    'dob_candidates': [
+        # Pattern with label (handles various OCR errors in "Date of Birth")
+        _compile(r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth|date\s+st\s+biosth|date\s+st|birth|bisth|biosth)[:\s\-\.]+(\d{1,2})[/.\-lI|](\d{1,2})[/.\-lI|](\d{2,4})', re.IGNORECASE),
+        # Generic date pattern (DD/MM/YYYY or MM/DD/YYYY) - handles various separators
+        _compile(r'(\d{1,2})[/.\-\s|lI](\d{1,2})[/.\-\s|lI](\d{4})', re.IGNORECASE),
+        # Date with 2-digit year
+        _compile(r'(\d{1,2})[/.\-\s|lI](\d{1,2})[/.\-\s|lI](\d{2})\b', re.IGNORECASE),
+        # Date without separators (DDMMYYYY or MMDDYYYY) - try to parse intelligently
+        _compile(r'(\d{1,2})(\d{2})(\d{4})', re.IGNORECASE),
+    ],
+    'pin': [
+        # Most specific: with labels (PIN/ZIP code labels)
+        _compile(r'(?:pin\s+code|pincode|zip\s+code|postal\s+code|zip|p\.?i\.?n\.?)[:\s\-]+(\d{4,6})\b', re.IGNORECASE),
+        _compile(r'(?:pin|pincode|zip)[:\s\-]+(\d{4,6})\b', re.IGNORECASE),
+        # Indian PIN codes are 6 digits, US ZIP codes are 5 digits
+        # Only match if it's clearly a PIN code (after address keywords, before phone/email)
+        _compile(r'(?:address|city|state|country|location|pincode)[^\d]*(\d{4,6})(?:\s*(?:phone|email|mobile|tel|$))', re.IGNORECASE),
+    ],
+    'aadhaar': [
+        _compile(r'(?:aadhaar|aadhar|uid)[:\s\-]+(\d{4}\s?\d{4}\s?\d{4})', re.IGNORECASE),
+        _compile(r'(?:aadhaar|aadhar|uid)[:\s\-]+(\d{12})', re.IGNORECASE),
+        _compile(r'\b(\d{4}\s?\d{4}\s?\d{4})\b', re.IGNORECASE),  # Format: XXXX XXXX XXXX
+        _compile(r'\b(\d{12})\b', re.IGNORECASE),  # 12 digits
+    ],
+    'parents_enhanced': [
+        # Handle "Parents ame:" (OCR error - missing 'N')
+        _compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\-\.]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
+        # Generic pattern
+        _compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\-\.]+([^\n:]{2,50}?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
+    ],
+    # PAN format: ABCDE1234F (5 letters, 4 digits, 1 letter)
+    'pan_labelled': _compile(r'(?:pan|permanent\s+account\s+number)[:\s\-]+([A-Z]{5}\d{4}[A-Z])', re.IGNORECASE),
+    'pan': _compile(r'\b([A-Z]{5}\d{4}[A-Z])\b'),
+    'passport': [
+        _compile(r'(?:passport|passport\s+no|passport\s+number)[:\s\-]+([A-Z0-9]{6,12})', re.IGNORECASE),
+        _compile(r'\b([A-Z]{1,2}\d{6,9})\b', re.IGNORECASE),  # Common passport formats
+    ],
+    'address_line1': [
+        _compile(r'(?:address\s+line\s*1|address\s+linet|adebress\s+linet|aderess\s+linet|address\s+linet1)[:\s]+([^\n:]+?)(?:\s+Address\s+Line\s*2|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)', re.IGNORECASE),
+        _compile(r'(?:address\s+line\s*1|address\s+linet)[:\s]+([^\n:]+?)(?:\n|Address\s+Line\s*2|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)', re.IGNORECASE),
+    ],
+    'address_line2': [
+        _compile(r'(?:address\s+line\s*2|address\s+linet2)[:\s]+([^\n:]+?)(?:\s+City|State|Country|Pin|Phone|Email|Mobile|Tel|$)', re.IGNORECASE),
+        _compile(r'(?:address\s+line\s*2)[:\s]+([^\n:]+?)(?:\n|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)', re.IGNORECASE),
+    ],
+    'address': [
+        # With labels - stop at City/State/Country/Pin/Phone/Email/Mobile (most specific)
+        _compile(r'(?:address|residence|location|addr\.?)[:\s]+([^\n:]+?)(?:\s+(?:City|State|Country|Pin|Phone|Email|Mobile|Tel|Mobile\s+Numb|Occupation|Date|Birth|Emailld)|$)', re.IGNORECASE | re.MULTILINE),
+
+        # Street address pattern - stop at City/State/Country/Mobile/Email
+        _compile(r'(\d+\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s+(?:Street|St|Avenue|Ave|Road|Rd|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Ct|Court|Parkway|Pkwy|Place|Pl))(?:\s+(?:City|State|Country|Pin|Phone|Email|Mobile|Tel|Mobile\s+Numb|Emailld)|$)', re.IGNORECASE | re.MULTILINE),
+
+        # With labels - multi-line version (stop at phone/email keywords)
+        _compile(r'(?:address|residence|location|addr\.?)[:\s\-]+(.+?)(?:\n\n|\n(?:phone|email|mobile|tel|mobile\s+numb|emailld|name|age|gender|contact|occupation|date|birth)|$)', re.IGNORECASE | re.MULTILINE),
+    ],
+}
+
+# Email-shaped substrings stripped out of address values
+_EMAIL_STRIP_RE = _compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Trailing field labels captured after a value (each field stops at its own set of labels)
+_TRAILING_FIELD_LABELS = {
+    'name': ('age', 'gender', 'phone', 'email', 'address', 'city', 'state', 'country', 'date', 'birth'),
+    'parents': ('occupation', 'phone', 'email', 'address', 'age', 'gender', 'mobile', 'date', 'birth'),
+    'occupation': ('phone', 'email', 'address', 'age', 'gender', 'mobile', 'date', 'birth', 'number'),
+    'address': ('city', 'state', 'country', 'phone', 'email', 'name', 'age', 'gender', 'mobile', 'tel', 'occupation', 'date', 'birth'),
+    'address_line1': ('city', 'state', 'country', 'pin', 'phone', 'email', 'mobile', 'tel'),
+    'address_line2': ('city', 'state', 'country', 'pin', 'code', 'phone', 'email', 'mobile', 'tel'),
+    'dynamic': ('phone', 'email', 'address', 'age', 'gender', 'mobile', 'date', 'birth', 'occupation', 'name', 'parents', 'city', 'state', 'country', 'pin', 'number', 'id', 'code'),
+}
+
+# The only multi-word stop label ("Address Line 2") is matched separately
+_ADDRESS_LINE2_LABEL_RE = re.compile(r'\s+Address\s+Line\s*2', re.IGNORECASE)
+
+# ASCII-only lowercasing keeps string offsets aligned with the original value
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+# Accepted shape of an extracted name after capitalization
+_VALID_NAME_RE = _compile(r'(?:\.|[A-Z.]\S+)(?:\s+(?:\.|[A-Z.]\S+)){1,4}')
+
+# Symbols removed by normalize_text: everything except word chars, whitespace and @.-+()
+_SYMBOL_STRIP_RE = re.compile(r'[^\w\s@.\-+()]')
+_ASCII_SYMBOLS_TO_SPACE = str.maketrans({
+    chr(code): ' ' for code in range(128) if _SYMBOL_STRIP_RE.match(chr(code))
+})
+
+# City/State/Country share one union pattern so a single scan fills all three
+_CITY_STATE_COUNTRY_RE = _compile(r'(?P<label>city|state|country)[:\s]+(?P<value>[A-Z][a-zA-Z]+)(?=\s+(?:State|Pin|Phone|Email|Code|Country)|$)', re.IGNORECASE)
+
+# Comprehensive OCR error correction dictionary used by fix_ocr_errors
+# Format: (incorrect, correct) - word replacements
+_WORD_CORRECTIONS = {
+    # Place names (Indian states/cities)
+    'kamataha': 'Karnataka',
+    'kamataka': 'Karnataka',
+    'kamatakha': 'Karnataka',
+    'karnatakha': 'Karnataka',
+    'karnatka': 'Karnataka',
+    'bangalor': 'Bangalore',
+    'bangalore': 'Bangalore',
+    'bengaluru': 'Bangalore',
+    'mumbai': 'Mumbai',
+    'mumbay': 'Mumbai',
+    'delhi': 'Delhi',
+    'delh': 'Delhi',
+    'chennai': 'Chennai',
+    'madras': 'Chennai',
+    'hyderabad': 'Hyderabad',
+    'pune': 'Pune',
+    'puna': 'Pune',
+
+    # Common words and field labels
+    'layeut': 'Layout',
+    'layaut': 'Layout',
+    'layot': 'Layout',
+    'adebress': 'Address',
+    'aderess': 'Address',
+    'adress': 'Address',
+    'adres': 'Address',
+    'linet': 'Line',
+    'linet1': 'Line1',
+    'linet2': 'Line2',
+    'grender': 'Gender',
+    'gendr': 'Gender',
+    'midde': 'Middle',
+    'middl': 'Middle',
+    'mmber': 'Number',
+    'numb': 'Number',
+    'numbber': 'Number',
+    'numbes': 'Number',
+    'phome': 'Phone',
+    'phne': 'Phone',
+    'emal': 'Email',
+    'emai': 'Email',
+    'emial': 'Email',
+    'emailld': 'EmailId',
+    'read': 'Road',
+    'rood': 'Road',
+    'strt': 'Street',
+    'stret': 'Street',
+    'stree': 'Street',
+    'streeet': 'Street',
+
+    # Common OCR mistakes in field labels
+    'neme': 'Name',
+    'mame': 'Name',
+    'norme': 'Name',
+    'occupation.': 'Occupation:',
+    'ocupation': 'Occupation',
+    'ocupation-': 'Occupation:',
+    'teachex': 'Teacher',
+    # Removed specific name fixes - these should be handled generically
+    'parents ame': 'Parents Name',
+    'parents': 'Parents',
+    'date st bisth': 'Date of Birth',
+    'date st': 'Date of Birth',
+    'bisth': 'Birth',
+    'mobile numbes': 'Mobile Number',
+    'mobile': 'Mobile',
+    'emailld': 'EmailId',
+    'emailid': 'EmailId',
+
+    # Common OCR character mistakes
+    'rn': 'm',  # rn -> m (in context)
+    'vv': 'w',  # vv -> w
+    'ii': 'n',  # ii -> n (context-dependent)
 }
 
+# Surrounding punctuation ignored when looking a token up in _WORD_CORRECTIONS
+_WORD_PUNCTUATION = '.,!?;:()[]{}"\''
+
+def _trie_regex(words) -> str:
+    """
+    Build a prefix-factored alternation for a set of literal words, e.g.
+    ['linet', 'linet1', 'layot'] -> 'l(?:ayot|inet(?:1)?)'. The regex engine then
+    walks it like a trie instead of retrying every word at each position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+# One scan replaces the per-token dict lookup: a token (run of non-space chars)
+# is corrected when, stripped of surrounding punctuation, it is a lowercase key.
+# Keys with spaces or edge punctuation can never equal a stripped token, so they
+# are left out of the trie.
+_WORD_CORRECTION_RE = re.compile(
+    r'(?<!\S)([' + re.escape(_WORD_PUNCTUATION) + r']*)('
+    + _trie_regex(
+        key for key in _WORD_CORRECTIONS
+        if ' ' not in key and key.strip(_WORD_PUNCTUATION) == key
+    )
+    + r')(?=[' + re.escape(_WORD_PUNCTUATION) + r']*(?!\S))'
+)
+
+
+# Tokens are only ever rewritten to the lowercase form of their correction
+_WORD_REPLACEMENTS = {key: value.lower() for key, value in _WORD_CORRECTIONS.items()}
+
+
+def _correct_word(match) -> str:
+    """Substitution callback for _WORD_CORRECTION_RE, keeping leading punctuation."""
+    prefix, word = match.group(1, 2)
+    return prefix + _WORD_REPLACEMENTS[word] if prefix else _WORD_REPLACEMENTS[word]
+
+
+# Regex-based OCR corrections applied in order by fix_ocr_errors
+# Each correction also names what its pattern cannot match without: a literal character,
+# any digit (_NEEDS_DIGIT) or nothing (None). No correction introduces a digit, '0' or
+# '.', so fix_ocr_errors skips every pass whose prerequisite is missing from the text.
+_NEEDS_DIGIT = 'digit'
+
+_PATTERN_CORRECTIONS = [
+    # Fix common character confusions in context
+    (re.compile(r'\b([A-Z])0([a-z])'), r'\1O\2', '0'),  # Capital letter + 0 -> O
+    (re.compile(r'([a-z])0([A-Z])'), r'\1O\2', '0'),  # 0 between letters -> O
+    (re.compile(r'\b0([A-Z][a-z]+)'), r'O\1', '0'),  # 0 at word start before capital -> O
+    (re.compile(r'([a-z]+)0\b'), r'\1O', '0'),  # 0 at word end after lowercase -> O
+
+    # Generic OCR character confusions (works for any text)
+    # Fix '0'/'O' confusion in words (but keep 0 in numbers)
+    (re.compile(r'\b([A-Za-z]+)0([A-Za-z]+)\b'), r'\1O\2', '0'),  # Letter-0-Letter -> Letter-O-Letter
+    # Fix 'l'/'I' confusion in dates (l/I often means 1 or /)
+    (re.compile(r'(\d)[lI](\d)'), r'\1/\2', _NEEDS_DIGIT),  # Number-l/I-Number -> Number/Number
+
+    # Fix spacing issues
+    (re.compile(r'([a-z])([A-Z])'), r'\1 \2', None),  # Add space between lowercase and uppercase
+    (re.compile(r'([A-Z])\.([A-Z])'), r'\1. \2', '.'),  # Fix spacing: "N.Surya" -> "N. Surya"
+    (re.compile(r'([A-Z])([A-Z][a-z])'), r'\1 \2', None),  # Add space between two words
+
+    # Fix common OCR mistakes in numbers
+    (re.compile(r'(\d)\s+(\d)'), r'\1\2', _NEEDS_DIGIT),  # Remove spaces in numbers
+    (re.compile(r'([a-z])(\d)'), r'\1 \2', _NEEDS_DIGIT),  # Add space before number
+    (re.compile(r'(\d)([a-z])'), r'\1 \2', _NEEDS_DIGIT),  # Add space after number
+
+    # Fix date OCR errors: 'l', 'I', or '|' in dates -> '/'
+    (re.compile(r'(\d{1,2})[lI|](\d{1,2})[lI|](\d{2,4})'), r'\1/\2/\3', _NEEDS_DIGIT),  # "05101l2005" -> "05/10/2005"
+    (re.compile(r'(\d{1,2})[lI|](\d{1,2})'), r'\1/\2', _NEEDS_DIGIT),  # Partial date fix
+]
+
+# Substitution and cleanup patterns used inside the extractors
+_WHITESPACE_RE = re.compile(r'\s+')
+_NEWLINES_RE = re.compile(r'\n+')
+_DIGITS_RE = re.compile(r'\d+')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_WORD_RE = re.compile(r'[^\w]')
+_PHONE_SEPARATORS_RE = re.compile(r'[-.\s()]')
+_PHONE_LIKE_RE = re.compile(r'\d{7,15}')
+_PHONE_LIKE_WORD_RE = re.compile(r'\b\d{7,15}\b')
+# Runs spelled as explicit backreferences: sre matches these without the generic
+# repeat machinery that '\1{n,}' needs, which makes the full-text pass cheaper
+_REPEATED_LETTERS_RE = re.compile(r'([a-zA-Z])\1\1+')
+_REPEATED_CHARS_RE = re.compile(r'(.)\1\1\1+')
+_LEADING_DOTS_RE = re.compile(r'^\.+')
+_INITIAL_SPACING_RE = re.compile(r'([A-Za-z])\.([A-Za-z])')
+_UPPER_INITIAL_SPACING_RE = re.compile(r'([A-Z])\.([A-Z])')
+_ZERO_IN_WORD_RE = re.compile(r'([A-Za-z])0([A-Za-z])')
+
+# Field-specific cleanup in clean_extracted_value
+_DOT_SPACING_RE = re.compile(r'\.\s*')
+_SPACE_BEFORE_DOT_RE = re.compile(r'\s+\.')
+_NAME_DISALLOWED_RE = re.compile(r'[^\w\s.\-]')
+_EMAIL_ZERO_RE = re.compile(r'([a-z])0([a-z])')
+_EMAIL_RN_RE = re.compile(r'([a-z])rn([a-z])')
+_PHONE_DISALLOWED_RE = re.compile(r'[^\d+\-()]')
+_DATE_SEPARATOR_OCR_RE = re.compile(r'[lI|]')
+_DATE_ZERO_OCR_RE = re.compile(r'[Oo]')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')  # below space, except \t and \n
+
+# Leading field labels captured along with a value
+_PHONE_LABEL_PREFIX_RE = re.compile(r'^(?:phone|mobile|tel|contact|ph|number|numbes|numb|num)\s*[:\-]?\s*', re.IGNORECASE)
+_PARENTS_LABEL_PREFIX_RE = re.compile(r'^(?:ame|name|parents|parent)\s*[:\-]?\s*', re.IGNORECASE)
+_OCCUPATION_LABEL_PREFIX_RE = re.compile(r'^(?:occupation|ocupation|job|profession)\s*[:\-]?\s*', re.IGNORECASE)
+_DYNAMIC_LABEL_PREFIX_RE = re.compile(r'^(?:phone|mobile|tel|contact|ph|number|numbes|numb|num|email|mail|emailld|emailid|address|addr|name|neme|mame|occupation|ocupation|job|date|birth|bisth|biosth|parents|parent|ame)\s*[:\-]?\s*', re.IGNORECASE)
+
+# extract_email / extract_occupation OCR fixes
+_EMAIL_PREFIX_RE = _compile(r'([a-zA-Z0-9._%+-]{1,})\s*@', re.IGNORECASE)
+_EMAIL_LOCAL_O_DIGIT_RE = re.compile(r'([a-z])o(\d)')
+_EMAIL_LOCAL_STO_RE = re.compile(r'sto(\d)')
+_OCCUPATION_X_SUFFIX_RE = re.compile(r'([a-z]+)x\b', re.IGNORECASE)
+_OCCUPATION_ES_SUFFIX_RE = re.compile(r'([a-z]+)es\b', re.IGNORECASE)
+
+# Letters OCR commonly reads in place of date digits, fixed in a single pass
+_DATE_DIGIT_FIX_TABLE = str.maketrans({'l': '1', 'I': '1', '|': '1', 'O': '0', 'o': '0'})
+
+# Digit presence gates the extractors whose every pattern needs a digit
+_DIGIT_RE = re.compile(r'\d')
+
+# Label anchors: every pattern of a group starts with one of these, so a cheap
+# search either rules the group out or tells the full patterns where to start
+_NAME_LABEL_RE = _compile(r'name|mame|norme|neme', re.IGNORECASE)
+_ADDRESS_LINE_LABEL_RE = _compile(r'(?:address|adebress|aderess)\s+line', re.IGNORECASE)
+_ADDRESS_LABEL_RE = _compile(r'address|residence|location|addr', re.IGNORECASE)
+
+
+def _label_prefix(pattern: 're.Pattern') -> 're.Pattern':
+    """Compile the label and separator run an address line pattern opens with."""
+    source = pattern.pattern
+    return re.compile(source[:source.index(r'[:\s]+') + len(r'[:\s]+')], re.IGNORECASE)
+
+
+# Stdlib-compiled address line patterns (no RE2) and their label prefixes; a value
+# never spans a newline or colon (see _search_address_line)
+_ADDRESS_LINE_PREFIXES = {
+    pattern: _label_prefix(pattern)
+    for group in ('address_line1', 'address_line2')
+    for pattern in _compiled_patterns[group]
+    if isinstance(pattern, re.Pattern)
+}
+_VALUE_BREAK_RE = re.compile(r'[\n:]')
+
+# Labels required by extractors that have no unlabelled fallback; one scan over the
+# text yields the set of fields worth trying (see extract_all_fields)
+_FIELD_KEYWORD_RE = _compile(
+    r'(?P<parents_name>parent)'
+    r'|(?P<occupation>occupation|ocupation|profession|job|designation)'
+    r'|(?P<passport>passport)',
+    re.IGNORECASE
+)
+
+# Fields whose extractor result depends only on these pattern groups matching the text
+# it is given (no rewritten text, no non-regex fallback)
+_PATTERN_GATED_FIELDS = {
+    'age': ('age', 'age_dob'),
+    'gender': ('gender',),
+    'phone': ('phone',),
+    'email': ('email_candidates',),
+    'date_of_birth': ('dob_candidates',),
+    'parents_name': ('parents_enhanced', 'parents'),
+    'occupation': ('occupation',),
+    'aadhaar': ('aadhaar',),
+    'pan': ('pan_labelled', 'pan'),
+    'passport': ('passport',),
+}
+
+
+def _build_pattern_set():
+    """
+    Add every RE2-compiled pattern of the gated fields to one RE2 set, which reports
+    all patterns matching a text in a single DFA pass (RE2's multi-pattern matcher).
+    Returns the compiled set and the field owning each set index, or (None, ()) when
+    RE2 is unavailable. Fields with a stdlib-re fallback pattern are never ruled out.
+    """
+    if re2 is None:
+        return None, ()
+    pattern_set = re2.Set.SearchSet(_re2_options)
+    owners = []
+    for field, groups in _PATTERN_GATED_FIELDS.items():
+        patterns = []
+        for group in groups:
+            compiled = _compiled_patterns[group]
+            patterns.extend(compiled if isinstance(compiled, list) else [compiled])
+        if any(isinstance(pattern, re.Pattern) for pattern in patterns):
+            continue
+        for pattern in patterns:
+            pattern_set.Add(pattern.re2_pattern.pattern)
+            owners.append(field)
+    pattern_set.Compile()
+    return pattern_set, tuple(owners)
+
+
+_PATTERN_SET, _PATTERN_SET_OWNERS = _build_pattern_set()
+_PATTERN_SET_FIELDS = frozenset(_PATTERN_SET_OWNERS)
+
+# Fallback address detection
+_PHONE_OR_EMAIL_RE = _compile(r'\d{7,15}|@')
+# Street words that, after a digit on the same line, mark an address-like line
+_STREET_HINT_RE = _compile(r'street|st|avenue|ave|road|rd|lane|ln|drive|dr|address|addr', re.IGNORECASE)
+
+# Map common OCR errors and variations in dynamic labels to standard field names
+_DYNAMIC_FIELD_MAPPING = {
+    'neme': 'name',
+    'mame': 'name',
+    'norme': 'name',
+    'full_name': 'name',
+    'applicant_name': 'name',
+    'date_of_birth': 'date_of_birth',
+    'dateofbirth': 'date_of_birth',
+    'dateofbisth': 'date_of_birth',
+    'datestbisth': 'date_of_birth',
+    'date_st_bisth': 'date_of_birth',
+    'dob': 'date_of_birth',
+    'birth_date': 'date_of_birth',
+    'parents_name': 'parents_name',
+    'parentsname': 'parents_name',
+    'parentsame': 'parents_name',
+    'parentname': 'parents_name',
+    'parent_name': 'parents_name',
+    'occupation': 'occupation',
+    'ocupation': 'occupation',
+    'profession': 'occupation',
+    'job': 'occupation',
+    'phone': 'phone',
+    'phone_number': 'phone',
+    'phonenumber': 'phone',
+    'mobile': 'phone',
+    'mobile_number': 'phone',
+    'mobilenumber': 'phone',
+    'mobilenumbes': 'phone',
+    'mobilenumb': 'phone',
+    'contact': 'phone',
+    'email': 'email',
+    'email_id': 'email',
+    'emailid': 'email',
+    'emailld': 'email',
+    'e_mail': 'email',
+    'e-mail': 'email',
+    'address': 'address',
+    'addr': 'address',
+    'residence': 'address',
+    'location': 'address',
+    'pin_code': 'pin_code',
+    'pincode': 'pin_code',
+    'zip_code': 'pin_code',
+    'postal_code': 'pin_code',
+    'city': 'city',
+    'state': 'state',
+    'country': 'country',
+    'age': 'age',
+    'gender': 'gender',
+    'sex': 'gender',
+}
+
+# Generic "Label: value" layouts picked up by extract_dynamic_fields, tried in order
+_DYNAMIC_LABEL_PATTERNS = [
+    # Pattern 1: "Label: Value" format (most common)
+    _compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    # Pattern 2: "Label Value" format (without colon)
+    _compile(r'^([a-zA-Z][a-zA-Z\s]{2,40}?)\s+([A-Z0-9@a-z].+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    # Pattern 3: "Label - Value" format
+    _compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)\s*-\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    # Pattern 4: "Label. Value" format
+    _compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)\s*\.\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+]
+# "Field Name:\nValue Line 1\nValue Line 2"
+_LABEL_MULTILINE_RE = re.compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+\n(.+?)(?=\n(?:[A-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+|\n*$)', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+_DATE_VALUE_RE = _compile(r'(\d{1,2}[/.\-lI]\d{1,2}[/.\-lI]\d{2,4})')
+
 # Multilingual keywords
 NAME_KEYWORDS = {
     'en': ['name', 'full name', 'applicant name', 'your name', 'first name', 'last name'],
@@ -85,159 +651,80 @@ AGE_KEYWORDS = {
 }
 
 
-def fix_ocr_errors(text: str) -> str:
+_detect_language_impl = None
+
+
+def _detect_language(sample: str) -> str:
     """
-    Premium OCR error correction: Comprehensive dictionary of common mistakes.
-    Fixes place names, common words, and character confusions.
+    Detect document language, importing the detector only when it is needed.
+    Pure-ASCII samples cannot contain Devanagari or Arabic script, so they
+    short-circuit to English without running the detector.
+    """
+    global _detect_language_impl
+    
+    if sample.isascii():
+        return 'en'
+    
+    if _detect_language_impl is None:
+        from utils.language_detector import detect_language as _detect_language_impl
+    return _detect_language_impl(sample, sample_size=len(sample))
+
+
+def _fields_ruled_out(*texts: str) -> frozenset:
+    """
+    Fields in _PATTERN_GATED_FIELDS that cannot match any of the texts (RE2 only).
+    Nothing is ruled out when a text would match differently under stdlib re.
+    """
+    if _PATTERN_SET is None or not all(_re2_agrees(text) for text in texts):
+        return frozenset()
+    matched = set()
+    for text in texts:
+        matched.update(_PATTERN_SET_OWNERS[index] for index in _PATTERN_SET.Match(text) or ())
+    return _PATTERN_SET_FIELDS.difference(matched)
+
+
+def _truncate_at_labels(value: str, field: str) -> str:
+    """
+    Cut a captured value at the first whitespace-preceded label of the next field.
     
     Args:
-        text: Raw OCR text
+        value: Captured field value
+        field: Key into _TRAILING_FIELD_LABELS
         
     Returns:
-        Text with common OCR errors corrected
+        Value with the trailing label (and everything after it) removed
     """
+    lowered = value.translate(_ASCII_LOWER)
+    cut = len(value)
+    for label in _TRAILING_FIELD_LABELS[field]:
+        index = lowered.find(label, 1)
+        while 0 < index < cut:
+            if lowered[index - 1].isspace():
+                cut = index
+                break
+            index = lowered.find(label, index + 1)
+    if cut == len(value):
+        return value
+    return value[:cut].rstrip()
+
+
+def _fix_ocr_errors(text: str) -> str:
+    """Uncached body of fix_ocr_errors."""
     if not text:
         return ""
     
     try:
-        # Comprehensive OCR error correction dictionary
-        # Format: (incorrect, correct) - case-insensitive word replacements
-        word_corrections = {
-            # Place names (Indian states/cities)
-            'kamataha': 'Karnataka',
-            'kamataka': 'Karnataka',
-            'kamatakha': 'Karnataka',
-            'karnatakha': 'Karnataka',
-            'karnatka': 'Karnataka',
-            'bangalor': 'Bangalore',
-            'bangalore': 'Bangalore',
-            'bengaluru': 'Bangalore',
-            'mumbai': 'Mumbai',
-            'mumbay': 'Mumbai',
-            'delhi': 'Delhi',
-            'delh': 'Delhi',
-            'chennai': 'Chennai',
-            'madras': 'Chennai',
-            'hyderabad': 'Hyderabad',
-            'pune': 'Pune',
-            'puna': 'Pune',
-            
-            # Common words and field labels
-            'layeut': 'Layout',
-            'layaut': 'Layout',
-            'layot': 'Layout',
-            'adebress': 'Address',
-            'aderess': 'Address',
-            'adress': 'Address',
-            'adres': 'Address',
-            'linet': 'Line',
-            'linet1': 'Line1',
-            'linet2': 'Line2',
-            'grender': 'Gender',
-            'gendr': 'Gender',
-            'midde': 'Middle',
-            'middl': 'Middle',
-            'mmber': 'Number',
-            'numb': 'Number',
-            'numbber': 'Number',
-            'numbes': 'Number',
-            'phome': 'Phone',
-            'phne': 'Phone',
-            'emal': 'Email',
-            'emai': 'Email',
-            'emial': 'Email',
-            'emailld': 'EmailId',
-            'read': 'Road',
-            'rood': 'Road',
-            'strt': 'Street',
-            'stret': 'Street',
-            'stree': 'Street',
-            'streeet': 'Street',
-            
-            # Common OCR mistakes in field labels
-            'neme': 'Name',
-            'mame': 'Name',
-            'norme': 'Name',
-            'occupation.': 'Occupation:',
-            'ocupation': 'Occupation',
-            'ocupation-': 'Occupation:',
-            'teachex': 'Teacher',
-            # Removed specific name fixes - these should be handled generically
-            'parents ame': 'Parents Name',
-            'parents': 'Parents',
-            'date st bisth': 'Date of Birth',
-            'date st': 'Date of Birth',
-            'bisth': 'Birth',
-            'mobile numbes': 'Mobile Number',
-            'mobile': 'Mobile',
-            'emailld': 'EmailId',
-            'emailid': 'EmailId',
-            
-            # Common OCR character mistakes
-            'rn': 'm',  # rn -> m (in context)
-            'vv': 'w',  # vv -> w
-            'ii': 'n',  # ii -> n (context-dependent)
-        }
-        
-        # Apply word-level corrections (case-insensitive)
-        words = text.split()
-        corrected_words = []
-        for word in words:
-            # Remove punctuation for matching, keep it for replacement
-            word_lower = word.lower().strip('.,!?;:()[]{}"\'')
-            if word_lower in word_corrections:
-                # Preserve original case pattern if possible
-                if word.isupper():
-                    corrected = word_corrections[word_lower].upper()
-                elif word[0].isupper():
-                    corrected = word_corrections[word_lower].capitalize()
-                else:
-                    corrected = word_corrections[word_lower].lower()
-                
-                # Replace the word, preserving punctuation
-                if word != word_lower:
-                    # Has punctuation - preserve it
-                    corrected = word.replace(word_lower, corrected)
-                corrected_words.append(corrected)
-            else:
-                corrected_words.append(word)
-        
-        text = ' '.join(corrected_words)
+        # Apply word-level corrections to whitespace-separated tokens
+        text = _WORD_CORRECTION_RE.sub(_correct_word, ' '.join(text.split()))
         
         # Pattern-based corrections (for character-level mistakes)
-        pattern_corrections = [
-            # Fix common character confusions in context
-            (r'\b([A-Z])0([a-z])', r'\1O\2'),  # Capital letter + 0 -> O
-            (r'([a-z])0([A-Z])', r'\1O\2'),  # 0 between letters -> O
-            (r'\b0([A-Z][a-z]+)', r'O\1'),  # 0 at word start before capital -> O
-            (r'([a-z]+)0\b', r'\1O'),  # 0 at word end after lowercase -> O
-            
-            # Generic OCR character confusions (works for any text)
-            # Fix '0'/'O' confusion in words (but keep 0 in numbers)
-            (r'\b([A-Za-z]+)0([A-Za-z]+)\b', r'\1O\2'),  # Letter-0-Letter -> Letter-O-Letter
-            # Fix 'l'/'I' confusion in dates (l/I often means 1 or /)
-            (r'(\d)[lI](\d)', r'\1/\2'),  # Number-l/I-Number -> Number/Number
-            
-            # Fix spacing issues
-            (r'([a-z])([A-Z])', r'\1 \2'),  # Add space between lowercase and uppercase
-            (r'([A-Z])\.([A-Z])', r'\1. \2'),  # Fix spacing: "N.Surya" -> "N. Surya"
-            (r'([A-Z])([A-Z][a-z])', r'\1 \2'),  # Add space between two words
-            
-            # Fix common OCR mistakes in numbers
-            (r'(\d)\s+(\d)', r'\1\2'),  # Remove spaces in numbers
-            (r'([a-z])(\d)', r'\1 \2'),  # Add space before number
-            (r'(\d)([a-z])', r'\1 \2'),  # Add space after number
-            
-            # Fix date OCR errors: 'l', 'I', or '|' in dates -> '/'
-            (r'(\d{1,2})[lI|](\d{1,2})[lI|](\d{2,4})', r'\1/\2/\3'),  # "05101l2005" -> "05/10/2005"
-            (r'(\d{1,2})[lI|](\d{1,2})', r'\1/\2'),  # Partial date fix
-        ]
-        
-        for pattern, replacement in pattern_corrections:
-            text = re.sub(pattern, replacement, text)
+        has_digit = _DIGIT_RE.search(text) is not None
+        for pattern, replacement, needs in _PATTERN_CORRECTIONS:
+            if needs is None or (has_digit if needs is _NEEDS_DIGIT else needs in text):
+                text = pattern.sub(replacement, text)
         
         # Fix repeated characters (common OCR error)
-        text = re.sub(r'([a-zA-Z])\1{2,}', r'\1\1', text)  # aaa -> aa
+        text = _REPEATED_LETTERS_RE.sub(r'\1\1', text)  # aaa -> aa
         
         return text.strip()
     except Exception as e:
@@ -245,6 +732,31 @@ def fix_ocr_errors(text: str) -> str:
         return text
 
 
+# Repeated OCR text (field values, common labels) is corrected once. Long blobs skip the
+# cache so they don't evict the small entries; call .cache_clear() to reset on reload.
+_TEXT_CACHE_MAX_LEN = 4096
+
+_fix_ocr_errors_cached = lru_cache(maxsize=8192)(_fix_ocr_errors)
+
+
+def fix_ocr_errors(text: str) -> str:
+    """
+    Premium OCR error correction: Comprehensive dictionary of common mistakes.
+    Fixes place names, common words, and character confusions.
+    
+    Args:
+        text: Raw OCR text
+        
+    Returns:
+        Text with common OCR errors corrected
+    """
+    if not text:
+        return ""
+    if len(text) < _TEXT_CACHE_MAX_LEN:
+        return _fix_ocr_errors_cached(text)
+    return _fix_ocr_errors(text)
+
+
 def clean_extracted_value(value: str, field_type: str = "generic") -> str:
     """
     Clean and correct extracted field value to ensure accuracy.
@@ -267,53 +779,53 @@ def clean_extracted_value(value: str, field_type: str = "generic") -> str:
         # Field-specific cleaning
         if field_type == "name":
             # Remove any numbers from names (OCR might capture)
-            cleaned = re.sub(r'\d+', '', cleaned)
+            cleaned = _DIGITS_RE.sub('', cleaned)
             # Fix spacing around periods (initials)
-            cleaned = re.sub(r'\.\s*', '. ', cleaned)
-            cleaned = re.sub(r'\s+\.', ' .', cleaned)
+            cleaned = _DOT_SPACING_RE.sub('. ', cleaned)
+            cleaned = _SPACE_BEFORE_DOT_RE.sub(' .', cleaned)
             # Remove special characters except periods and hyphens
-            cleaned = re.sub(r'[^\w\s.\-]', '', cleaned)
+            cleaned = _NAME_DISALLOWED_RE.sub('', cleaned)
             
         elif field_type == "email":
             # Remove spaces in email
             cleaned = cleaned.replace(' ', '')
             # Fix common OCR errors in email
-            cleaned = re.sub(r'([a-z])0([a-z])', r'\1o\2', cleaned)  # 0 -> o in email
-            cleaned = re.sub(r'([a-z])rn([a-z])', r'\1m\2', cleaned)  # rn -> m
+            cleaned = _EMAIL_ZERO_RE.sub(r'\1o\2', cleaned)  # 0 -> o in email
+            cleaned = _EMAIL_RN_RE.sub(r'\1m\2', cleaned)  # rn -> m
             # Ensure valid email format
             if '@' not in cleaned:
                 return ""
             
         elif field_type == "phone":
             # Remove all non-digit characters except +, -, (, )
-            cleaned = re.sub(r'[^\d+\-()]', '', cleaned)
+            cleaned = _PHONE_DISALLOWED_RE.sub('', cleaned)
             # Remove leading/trailing non-digits
             cleaned = cleaned.strip('+-()')
             
         elif field_type == "date":
             # Fix common date OCR errors
-            cleaned = re.sub(r'[lI|]', '/', cleaned)  # l/I/| -> /
-            cleaned = re.sub(r'[Oo]', '0', cleaned)  # O/o -> 0 in dates
+            cleaned = _DATE_SEPARATOR_OCR_RE.sub('/', cleaned)  # l/I/| -> /
+            cleaned = _DATE_ZERO_OCR_RE.sub('0', cleaned)  # O/o -> 0 in dates
             # Remove spaces in dates
-            cleaned = re.sub(r'\s+', '', cleaned)
+            cleaned = _WHITESPACE_RE.sub('', cleaned)
             
         elif field_type == "number":
             # Remove all non-digit characters
-            cleaned = re.sub(r'[^\d]', '', cleaned)
+            cleaned = _NON_DIGIT_RE.sub('', cleaned)
             
         # Generic cleaning for all fields
         # Remove leading/trailing whitespace
         cleaned = cleaned.strip()
         
         # Remove excessive spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned)
         
         # Remove leading/trailing punctuation (except for emails, dates)
         if field_type not in ["email", "date", "phone"]:
             cleaned = cleaned.strip('.,;:!?')
         
         # Remove control characters
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\t')
+        cleaned = _CONTROL_CHARS_RE.sub('', cleaned)
         
         return cleaned.strip()
     except Exception as e:
@@ -321,31 +833,38 @@ def clean_extracted_value(value: str, field_type: str = "generic") -> str:
         return value.strip() if value else ""
 
 
-def normalize_text(text: str) -> str:
+def _proper_case(text: str) -> str:
     """
-    Enhanced normalization: strip noise, fix repeated characters, remove symbols.
-    
-    Args:
-        text: Raw OCR text
-        
-    Returns:
-        Normalized text
+    Proper-case every word that starts with a letter ("rAM" -> "Ram") and collapse
+    whitespace. Words starting with anything else, like ".Surya", are kept as-is.
     """
+    return ' '.join(
+        word[0].upper() + word[1:].lower() if word[0].isalpha() else word
+        for word in text.split()
+    )
+
+
+def _normalize_text(text: str) -> str:
+    """Uncached body of normalize_text."""
     if not text:
         return ""
     
     try:
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace (fix_ocr_errors strips the ends later)
+        text = ' '.join(text.split())
         
         # Fix repeated characters (e.g., "naaaame" -> "name")
-        text = re.sub(r'(.)\1{3,}', r'\1\1', text)
+        text = _REPEATED_CHARS_RE.sub(r'\1\1', text)
         
         # Fix common OCR errors
         text = fix_ocr_errors(text)
         
         # Remove special symbols but keep basic punctuation
-        text = re.sub(r'[^\w\s@.\-+()]', ' ', text)
+        # (ASCII text goes through a translate table; the regex handles Unicode word characters)
+        if text.isascii():
+            text = text.translate(_ASCII_SYMBOLS_TO_SPACE)
+        else:
+            text = _SYMBOL_STRIP_RE.sub(' ', text)
         
         # Fix broken words (common OCR errors)
         words = text.split()
@@ -361,6 +880,26 @@ def normalize_text(text: str) -> str:
         return text
 
 
+_normalize_text_cached = lru_cache(maxsize=8192)(_normalize_text)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Enhanced normalization: strip noise, fix repeated characters, remove symbols.
+    
+    Args:
+        text: Raw OCR text
+        
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+    if len(text) < _TEXT_CACHE_MAX_LEN:
+        return _normalize_text_cached(text)
+    return _normalize_text(text)
+
+
 def parse_name_components(full_name: str) -> Dict[str, Optional[str]]:
     """
     Parse full name into first name, middle name, and last name components.
@@ -451,54 +990,40 @@ def extract_name(text: str, language: str = 'en') -> Optional[str]:
         if not language:
             language = 'en'
         
-        # Use compiled patterns for speed
-        for pattern in _compiled_patterns['name']:
+        # Use compiled patterns for speed (both need a name label somewhere in the text)
+        name_patterns = _compiled_patterns['name'] if _NAME_LABEL_RE.search(text) else ()
+        for pattern in name_patterns:
             match = pattern.search(text)
             if match:
                 name = match.group(1).strip()
                 # Clean up trailing labels
-                name = re.sub(r'\s+(Age|Gender|Phone|Email|Address|City|State|Country|Date|Birth).*$', '', name, flags=re.IGNORECASE)
+                name = _truncate_at_labels(name, 'name')
                 name = name.strip()
                 
                 # Generic OCR error fixes for names (works for any name)
                 # Fix spacing: "N.Surya" -> "N. Surya"
-                name = re.sub(r'([A-Za-z])\.([A-Za-z])', r'\1. \2', name)
+                name = _INITIAL_SPACING_RE.sub(r'\1. \2', name)
                 # Fix missing space after period: "N.Surya" -> "N. Surya"
-                name = re.sub(r'([A-Za-z])\.([A-Za-z])', r'\1. \2', name)
+                name = _INITIAL_SPACING_RE.sub(r'\1. \2', name)
                 
                 # Generic capitalization: Proper case for names (first letter uppercase, rest lowercase)
-                words = name.split()
-                capitalized_words = []
-                for word in words:
-                    if word and word[0].isalpha():
-                        # Capitalize first letter, lowercase rest (standard name format)
-                        if len(word) > 1:
-                            capitalized_words.append(word[0].upper() + word[1:].lower())
-                        else:
-                            capitalized_words.append(word.upper())
-                    elif word.startswith('.'):
-                        # Handle initials like ".Surya" -> ". Surya"
-                        capitalized_words.append(word)
-                    else:
-                        capitalized_words.append(word)
-                name = ' '.join(capitalized_words)
+                name = _proper_case(name)
                 
                 # Generic fix: common OCR character confusions in names
                 # Fix 'l'/'I' confusion (but be careful - context dependent)
                 # Fix '0'/'O' in names (O is more common in names)
-                name = re.sub(r'([A-Za-z])0([A-Za-z])', r'\1O\2', name)
+                name = _ZERO_IN_WORD_RE.sub(r'\1O\2', name)
                 
-                # Validate name format
-                words = name.split()
-                if 2 <= len(words) <= 5 and all(w and (w[0].isupper() or w[0] == '.') and len(w) > 1 for w in words if w != '.'):
+                # Validate name format: 2-5 capitalized words (initials and lone periods allowed)
+                if _VALID_NAME_RE.fullmatch(name):
                     # Clean the name before returning
-                    cleaned_name = clean_extracted_value(normalize_text(name), "name")
+                    # clean_extracted_value runs the full normalize_text pass itself
+                    cleaned_name = clean_extracted_value(name, "name")
                     return cleaned_name if cleaned_name else normalize_text(name)
         
         # Fallback: first capitalized line
         if language == 'en':
-            lines = text.split('\n')
-            for line in lines[:3]:  # Check only first 3 lines for speed
+            for line in text.split('\n', 3)[:3]:  # Check only first 3 lines for speed
                 line = line.strip()
                 if not line or ':' in line:
                     continue
@@ -516,36 +1041,22 @@ def extract_age(text: str) -> Optional[str]:
     """Extract age from text with improved patterns. Also calculates from date of birth."""
     try:
         # First try explicit age patterns
-        patterns = [
-            # Explicit labels
-            r'(?:age|years?\s+old|yrs?\.?)[:\s\-]+(\d{1,3})',
-            r'\b(\d{1,3})\s*(?:years?\s+old|yrs?\.?|y\.?o\.?)',
-            
-            # Pattern: Age: 25
-            r'age[:\s]+(\d{1,3})',
-        ]
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _compiled_patterns['age']:
+            for match in pattern.finditer(text):
                 try:
-                    age = int(match)
+                    age = int(match.group(1))
                     if 1 <= age <= 150:
-                        logger.info(f"[AGE] Extracted: {age}")
+                        logger.info("[AGE] Extracted: %s", age)
                         return str(age)
                 except ValueError:
                     continue
         
         # If no explicit age found, try to calculate from date of birth
         # Look for date of birth patterns
-        dob_patterns = [
-            r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth)[:\s\-]+(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{2,4})',
-            r'(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4})',  # DD/MM/YYYY or MM/DD/YYYY
-            r'(\d{4})[/.\-](\d{1,2})[/.\-](\d{1,2})',  # YYYY/MM/DD
-        ]
-        
-        for pattern in dob_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        
+        for pattern in _compiled_patterns['age_dob']:
+            match = pattern.search(text)
             if match:
                 try:
                     # Try to parse the date
@@ -568,7 +1079,7 @@ def extract_age(text: str) -> Optional[str]:
                         age = current_year - year
                         
                         if 1 <= age <= 150:
-                            logger.info(f"[AGE] Calculated from DOB year {year}: {age}")
+                            logger.info("[AGE] Calculated from DOB year %s: %s", year, age)
                             return str(age)
                 except (ValueError, IndexError):
                     continue
@@ -582,18 +1093,9 @@ def extract_age(text: str) -> Optional[str]:
 def extract_gender(text: str) -> Optional[str]:
     """Extract gender from text with improved patterns."""
     try:
-        patterns = [
-            # Explicit labels
-            r'(?:gender|sex)[:\s\-]+(male|female|other|m|f|m\.|f\.)',
-            r'(?:gender|sex)[:\s\-]+([MF])',
-            
-            # Standalone mentions
-            r'\b(male|female|other)\b',
-            r'\b([MF])\b',  # Single letter
-        ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _compiled_patterns['gender']:
+            match = pattern.search(text)
             if match:
                 gender = match.group(1).lower().strip('.')
                 if gender in ['m', 'male']:
@@ -614,16 +1116,15 @@ def extract_phone(text: str) -> Optional[str]:
     try:
         # Use compiled patterns for speed
         for pattern in _compiled_patterns['phone']:
-            matches = pattern.findall(text)
-            for match in matches:
+            for match in pattern.finditer(text):
                 # Remove any label text that might have been captured (generic fix)
                 # Remove common label words that OCR might capture
-                phone_value = match.strip()
+                phone_value = match.group(1).strip()
                 # Remove label words that might be at the start (case-insensitive)
-                phone_value = re.sub(r'^(?:phone|mobile|tel|contact|ph|number|numbes|numb|num)\s*[:\-]?\s*', '', phone_value, flags=re.IGNORECASE)
+                phone_value = _PHONE_LABEL_PREFIX_RE.sub('', phone_value)
                 phone_value = phone_value.strip()
                 
-                phone_clean = re.sub(r'[-.\s()]', '', phone_value)
+                phone_clean = _PHONE_SEPARATORS_RE.sub('', phone_value)
                 if 7 <= len(phone_clean) <= 15 and phone_clean.isdigit():
                     # Clean the phone before returning
                     cleaned_phone = clean_extracted_value(phone_value, "phone")
@@ -639,28 +1140,13 @@ def extract_phone(text: str) -> Optional[str]:
 def extract_email(text: str) -> Optional[str]:
     """Extract email from text with improved patterns. Handles spaces in email addresses and incomplete emails."""
     try:
-        logger.info(f"[EMAIL] Extracting from text: {text[:200]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[EMAIL] Extracting from text: %s", text[:200])
         
         # Enhanced email patterns - handle spaces in email (OCR error)
-        patterns = [
-            # With labels - handle spaces in email (most specific) - capture full email including spaces
-            r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+(?:\s+[a-zA-Z0-9._%+-]+)*)\s*@\s*([a-zA-Z0-9.-]+)\s*\.\s*([a-zA-Z]{2,})',
-            
-            # Standard email with spaces between parts
-            r'([a-zA-Z0-9._%+-]+(?:\s+[a-zA-Z0-9._%+-]+)*)\s*@\s*([a-zA-Z0-9.-]+)\s*\.\s*([a-zA-Z]{2,})',
-            
-            # Standard email without spaces (most common)
-            r'(?:email|e-mail|mail|email\s+id|emailid|emailld)[:\s\-]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            
-            # Standalone email (no label)
-            r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
-            
-            # Handle common OCR errors in emails
-            r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.(?:com|net|org|edu|gov|in|co))',
-        ]
         
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _compiled_patterns['email_candidates']:
+            match = pattern.search(text)
             if match:
                 # Handle patterns with separate groups (for emails with spaces)
                 if len(match.groups()) == 3:
@@ -678,14 +1164,14 @@ def extract_email(text: str) -> Optional[str]:
                         # Look backwards for alphanumeric characters (up to 30 chars before)
                         before_at = text[max(0, match_pos-30):match_pos]
                         # Try to extract potential email prefix (look for alphanumeric text before @)
-                        prefix_match = re.search(r'([a-zA-Z0-9._%+-]{1,})\s*@', before_at, re.IGNORECASE)
+                        prefix_match = _EMAIL_PREFIX_RE.search(before_at)
                         if prefix_match:
                             local_part = prefix_match.group(1).replace(' ', '')
                     
                     if local_part and domain_part and tld:
                         email = f"{local_part}@{domain_part}.{tld}"
                     else:
-                        logger.warning(f"[EMAIL] Incomplete email parts: local={local_part}, domain={domain_part}, tld={tld}")
+                        logger.warning("[EMAIL] Incomplete email parts: local=%s, domain=%s, tld=%s", local_part, domain_part, tld)
                         continue
                 else:
                     email = match.group(1)
@@ -698,7 +1184,7 @@ def extract_email(text: str) -> Optional[str]:
                     while email and len(email) > 1 and email[0] in ['l', 'I', '1', 'd']:
                         test_email = email[1:]
                         if '@' in test_email and test_email.count('@') == 1:
-                            logger.info(f"[EMAIL] Removed leading OCR error character '{email[0]}'")
+                            logger.debug("[EMAIL] Removed leading OCR error character '%s'", email[0])
                             email = test_email
                         else:
                             break
@@ -710,16 +1196,16 @@ def extract_email(text: str) -> Optional[str]:
                         local, domain = email.split('@', 1)
                         # Fix common OCR mistakes: 'o' before numbers often should be 'r'
                         # Pattern: letter + 'o' + number -> letter + 'r' + number
-                        local = re.sub(r'([a-z])o(\d)', r'\1r\2', local)
+                        local = _EMAIL_LOCAL_O_DIGIT_RE.sub(r'\1r\2', local)
                         # Fix 'sto' -> 'str' (common pattern)
-                        local = re.sub(r'sto(\d)', r'str\1', local)
+                        local = _EMAIL_LOCAL_STO_RE.sub(r'str\1', local)
                         email = f"{local}@{domain}"
                 
                 # Fix '0' vs 'o' in email (but be careful - 0 can be valid)
                 # Only fix if it's clearly wrong (like '0@gmail.com' -> probably 'o')
                 if email.startswith('0') and '@' in email:
                     # Don't auto-fix, but log it
-                    logger.info(f"[EMAIL] Email starts with 0: {email}")
+                    logger.debug("[EMAIL] Email starts with 0: %s", email)
                 
                 # Basic validation
                 if '@' in email and '.' in email.split('@')[1]:
@@ -728,10 +1214,10 @@ def extract_email(text: str) -> Optional[str]:
                     if len(local) >= 1 and len(domain) >= 3:
                         # Clean the email before returning
                         cleaned_email = clean_extracted_value(email, "email")
-                        logger.info(f"[EMAIL] Extracted: {cleaned_email}")
+                        logger.info("[EMAIL] Extracted: %s", cleaned_email)
                         return cleaned_email if cleaned_email else email
                     else:
-                        logger.warning(f"[EMAIL] Invalid email format: {email} (local={len(local)}, domain={len(domain)})")
+                        logger.warning("[EMAIL] Invalid email format: %s (local=%s, domain=%s)", email, len(local), len(domain))
         
         logger.warning("[EMAIL] No email found")
         return None
@@ -744,33 +1230,23 @@ def extract_date_of_birth(text: str) -> Optional[str]:
     """Extract date of birth from text. Handles OCR errors generically for any date format. Optimized for speed."""
     try:
         # Enhanced patterns that handle OCR errors in date labels and formats
-        patterns = [
-            # Pattern with label (handles various OCR errors in "Date of Birth")
-            r'(?:date\s+of\s+birth|dob|birth\s+date|d\.o\.b\.?|date\s+st\s+bisth|date\s+st\s+biosth|date\s+st|birth|bisth|biosth)[:\s\-\.]+(\d{1,2})[/.\-lI|](\d{1,2})[/.\-lI|](\d{2,4})',
-            # Generic date pattern (DD/MM/YYYY or MM/DD/YYYY) - handles various separators
-            r'(\d{1,2})[/.\-\s|lI](\d{1,2})[/.\-\s|lI](\d{4})',
-            # Date with 2-digit year
-            r'(\d{1,2})[/.\-\s|lI](\d{1,2})[/.\-\s|lI](\d{2})\b',
-            # Date without separators (DDMMYYYY or MMDDYYYY) - try to parse intelligently
-            r'(\d{1,2})(\d{2})(\d{4})',
-        ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _compiled_patterns['dob_candidates']:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 3:
                     day, month, year = match.groups()
                     
                     # Generic OCR error fixes: common character confusions
                     # 'l', 'I', '|' are often OCR mistakes for '1' or '/'
-                    day = day.replace('l', '1').replace('I', '1').replace('|', '1').replace('O', '0').replace('o', '0')
-                    month = month.replace('l', '1').replace('I', '1').replace('|', '1').replace('O', '0').replace('o', '0')
-                    year = year.replace('l', '1').replace('I', '1').replace('|', '1').replace('O', '0').replace('o', '0')
+                    day = day.translate(_DATE_DIGIT_FIX_TABLE)
+                    month = month.translate(_DATE_DIGIT_FIX_TABLE)
+                    year = year.translate(_DATE_DIGIT_FIX_TABLE)
                     
                     # Remove any non-digit characters
-                    day = re.sub(r'[^\d]', '', day)
-                    month = re.sub(r'[^\d]', '', month)
-                    year = re.sub(r'[^\d]', '', year)
+                    day = _NON_DIGIT_RE.sub('', day)
+                    month = _NON_DIGIT_RE.sub('', month)
+                    year = _NON_DIGIT_RE.sub('', year)
                     
                     # Validate digits
                     if not (day.isdigit() and month.isdigit() and year.isdigit()):
@@ -802,47 +1278,38 @@ def extract_date_of_birth(text: str) -> Optional[str]:
 def extract_pin_code(text: str, phone_number: Optional[str] = None) -> Optional[str]:
     """Extract PIN/ZIP code from text. Excludes phone numbers."""
     try:
-        logger.info(f"[PIN] Extracting from text: {text[:200]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[PIN] Extracting from text: %s", text[:200])
         
         # Remove phone number from text if provided to avoid confusion
         text_for_pin = text
         if phone_number:
             # Remove the phone number from text to avoid matching it as PIN
-            phone_clean = re.sub(r'[-.\s()]', '', phone_number)
-            # Remove all occurrences of the phone number
-            text_for_pin = re.sub(re.escape(phone_number), ' ', text_for_pin)
-            text_for_pin = re.sub(re.escape(phone_clean), ' ', text_for_pin)
-            # Also remove any 10-digit numbers that match the phone pattern
-            text_for_pin = re.sub(r'\b' + re.escape(phone_clean) + r'\b', ' ', text_for_pin)
-            logger.info(f"[PIN] Removed phone number {phone_number} from text")
-        
-        patterns = [
-            # Most specific: with labels (PIN/ZIP code labels)
-            r'(?:pin\s+code|pincode|zip\s+code|postal\s+code|zip|p\.?i\.?n\.?)[:\s\-]+(\d{4,6})\b',
-            r'(?:pin|pincode|zip)[:\s\-]+(\d{4,6})\b',
-            # Indian PIN codes are 6 digits, US ZIP codes are 5 digits
-            # Only match if it's clearly a PIN code (after address keywords, before phone/email)
-            r'(?:address|city|state|country|location|pincode)[^\d]*(\d{4,6})(?:\s*(?:phone|email|mobile|tel|$))',
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            matches = re.findall(pattern, text_for_pin, re.IGNORECASE)
-            logger.info(f"[PIN] Pattern {i} matches: {matches}")
-            for match in matches:
-                pin = match.strip() if isinstance(match, str) else str(match).strip()
+            phone_clean = _PHONE_SEPARATORS_RE.sub('', phone_number)
+            # Remove all occurrences of the phone number (plain substring replaces, so
+            # per-document numbers never churn the re module's pattern cache)
+            text_for_pin = text_for_pin.replace(phone_number, ' ')
+            text_for_pin = text_for_pin.replace(phone_clean, ' ')
+            logger.info("[PIN] Removed phone number %s from text", phone_number)
+        
+        for i, pattern in enumerate(_compiled_patterns['pin']):
+            # Every PIN pattern has a single group; stop at the first valid one
+            for match in pattern.finditer(text_for_pin):
+                pin = match.group(1).strip()
+                if __debug__ and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[PIN] Pattern %d matched: %s", i, pin)
                 # Validate: PIN codes are typically 4-6 digits (not 7-15 like phone numbers)
                 if 4 <= len(pin) <= 6 and pin.isdigit():
                     # Additional validation: exclude if it's the same as phone number
                     if phone_number:
-                        phone_clean = re.sub(r'[-.\s()]', '', phone_number)
                         if pin in phone_clean or phone_clean.startswith(pin) or pin in phone_clean:
-                            logger.info(f"[PIN] Skipping {pin} - matches phone number {phone_clean}")
+                            logger.debug("[PIN] Skipping %s - matches phone number %s", pin, phone_clean)
                             continue
                     # Exclude if it's 10 digits (definitely a phone number)
                     if len(pin) >= 7:
-                        logger.info(f"[PIN] Skipping {pin} - too long for PIN code")
+                        logger.debug("[PIN] Skipping %s - too long for PIN code", pin)
                         continue
-                    logger.info(f"[PIN] Extracted: {pin}")
+                    logger.info("[PIN] Extracted: %s", pin)
                     return pin
         
         logger.warning("[PIN] No valid PIN code found")
@@ -855,22 +1322,16 @@ def extract_pin_code(text: str, phone_number: Optional[str] = None) -> Optional[
 def extract_aadhaar(text: str) -> Optional[str]:
     """Extract Aadhaar number from text (Indian ID)."""
     try:
-        patterns = [
-            r'(?:aadhaar|aadhar|uid)[:\s\-]+(\d{4}\s?\d{4}\s?\d{4})',
-            r'(?:aadhaar|aadhar|uid)[:\s\-]+(\d{12})',
-            r'\b(\d{4}\s?\d{4}\s?\d{4})\b',  # Format: XXXX XXXX XXXX
-            r'\b(\d{12})\b',  # 12 digits
-        ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _compiled_patterns['aadhaar']:
+            match = pattern.search(text)
             if match:
                 aadhaar = match.group(1).strip().replace(' ', '')
                 # Validate: should be 12 digits
                 if len(aadhaar) == 12 and aadhaar.isdigit():
                     # Format as XXXX XXXX XXXX
                     formatted = f"{aadhaar[:4]} {aadhaar[4:8]} {aadhaar[8:]}"
-                    logger.info(f"[AADHAAR] Extracted: {formatted}")
+                    logger.info("[AADHAAR] Extracted: %s", formatted)
                     return formatted
         
         return None
@@ -882,20 +1343,17 @@ def extract_aadhaar(text: str) -> Optional[str]:
 def extract_pan(text: str) -> Optional[str]:
     """Extract PAN (Permanent Account Number) from text (Indian tax ID)."""
     try:
-        # PAN format: ABCDE1234F (5 letters, 4 digits, 1 letter)
-        pattern = r'(?:pan|permanent\s+account\s+number)[:\s\-]+([A-Z]{5}\d{4}[A-Z])'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _compiled_patterns['pan_labelled'].search(text)
         if match:
             pan = match.group(1).upper()
-            logger.info(f"[PAN] Extracted: {pan}")
+            logger.info("[PAN] Extracted: %s", pan)
             return pan
         
         # Also try without label
-        pattern = r'\b([A-Z]{5}\d{4}[A-Z])\b'
-        match = re.search(pattern, text)
+        match = _compiled_patterns['pan'].search(text)
         if match:
             pan = match.group(1).upper()
-            logger.info(f"[PAN] Extracted (no label): {pan}")
+            logger.info("[PAN] Extracted (no label): %s", pan)
             return pan
         
         return None
@@ -908,42 +1366,24 @@ def extract_parents_name(text: str) -> Optional[str]:
     """Extract parents name from text with improved OCR error handling. Optimized for speed."""
     try:
         # Enhanced patterns that handle OCR errors in labels (e.g., "Parents ame:" instead of "Parents Name:")
-        enhanced_patterns = [
-            # Handle "Parents ame:" (OCR error - missing 'N')
-            re.compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\-\.]+([A-Za-z][a-zA-Z.]+(?:\s+[A-Za-z][a-zA-Z]+)+?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
-            # Generic pattern
-            re.compile(r'(?:parents\s+name|parent\s+name|parents\s+ame|parent\s+ame)[:\s\-\.]+([^\n:]{2,50}?)(?:\s+(?:Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth|$))', re.IGNORECASE),
-        ]
         
         # Try enhanced patterns first
-        for pattern in enhanced_patterns:
+        for pattern in _compiled_patterns['parents_enhanced']:
             match = pattern.search(text)
             if match:
                 parents_name = match.group(1).strip()
                 # Remove label words that might be captured (generic fix)
-                parents_name = re.sub(r'^(?:ame|name|parents|parent)\s*[:\-]?\s*', '', parents_name, flags=re.IGNORECASE)
-                parents_name = re.sub(r'\s+(Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth).*$', '', parents_name, flags=re.IGNORECASE)
-                parents_name = re.sub(r'^\.+', '', parents_name)  # Remove leading periods
-                parents_name = re.sub(r'([A-Za-z])\.([A-Za-z])', r'\1. \2', parents_name)  # Fix spacing
+                parents_name = _PARENTS_LABEL_PREFIX_RE.sub('', parents_name)
+                parents_name = _truncate_at_labels(parents_name, 'parents')
+                parents_name = _LEADING_DOTS_RE.sub('', parents_name)  # Remove leading periods
+                parents_name = _INITIAL_SPACING_RE.sub(r'\1. \2', parents_name)  # Fix spacing
                 
                 # Generic OCR error fixes for parents names (works for any name)
                 # Generic capitalization: Proper case for names
-                words = parents_name.split()
-                capitalized_words = []
-                for word in words:
-                    if word and word[0].isalpha():
-                        if len(word) > 1:
-                            capitalized_words.append(word[0].upper() + word[1:].lower())
-                        else:
-                            capitalized_words.append(word.upper())
-                    elif word.startswith('.'):
-                        capitalized_words.append(word)
-                    else:
-                        capitalized_words.append(word)
-                parents_name = ' '.join(capitalized_words)
+                parents_name = _proper_case(parents_name)
                 
                 # Generic fix: common OCR character confusions
-                parents_name = re.sub(r'([A-Za-z])0([A-Za-z])', r'\1O\2', parents_name)
+                parents_name = _ZERO_IN_WORD_RE.sub(r'\1O\2', parents_name)
                 
                 if len(parents_name) > 2:
                     return normalize_text(parents_name)
@@ -953,9 +1393,9 @@ def extract_parents_name(text: str) -> Optional[str]:
             match = pattern.search(text)
             if match:
                 parents_name = match.group(1).strip()
-                parents_name = re.sub(r'\s+(Occupation|Phone|Email|Address|Age|Gender|Mobile|Date|Birth).*$', '', parents_name, flags=re.IGNORECASE)
-                parents_name = re.sub(r'^\.+', '', parents_name)  # Remove leading periods
-                parents_name = re.sub(r'([A-Z])\.([A-Z])', r'\1. \2', parents_name)  # Fix spacing
+                parents_name = _truncate_at_labels(parents_name, 'parents')
+                parents_name = _LEADING_DOTS_RE.sub('', parents_name)  # Remove leading periods
+                parents_name = _UPPER_INITIAL_SPACING_RE.sub(r'\1. \2', parents_name)  # Fix spacing
                 if len(parents_name) > 2:
                     return normalize_text(parents_name)
         
@@ -968,18 +1408,14 @@ def extract_parents_name(text: str) -> Optional[str]:
 def extract_passport(text: str) -> Optional[str]:
     """Extract passport number from text."""
     try:
-        patterns = [
-            r'(?:passport|passport\s+no|passport\s+number)[:\s\-]+([A-Z0-9]{6,12})',
-            r'\b([A-Z]{1,2}\d{6,9})\b',  # Common passport formats
-        ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _compiled_patterns['passport']:
+            match = pattern.search(text)
             if match:
                 passport = match.group(1).upper()
                 # Basic validation
                 if 6 <= len(passport) <= 12:
-                    logger.info(f"[PASSPORT] Extracted: {passport}")
+                    logger.info("[PASSPORT] Extracted: %s", passport)
                     return passport
         
         return None
@@ -997,16 +1433,16 @@ def extract_occupation(text: str) -> Optional[str]:
             if match:
                 occupation = match.group(1).strip()
                 # Remove label words that might be captured
-                occupation = re.sub(r'^(?:occupation|ocupation|job|profession)\s*[:\-]?\s*', '', occupation, flags=re.IGNORECASE)
-                occupation = re.sub(r'\s+(Phone|Email|Address|Age|Gender|Mobile|Date|Birth|Mobile|Number).*$', '', occupation, flags=re.IGNORECASE)
+                occupation = _OCCUPATION_LABEL_PREFIX_RE.sub('', occupation)
+                occupation = _truncate_at_labels(occupation, 'occupation')
                 occupation = occupation.rstrip('.').strip()
                 
                 if len(occupation) > 2:
                     # Generic OCR error fixes for occupations
                     # Fix common OCR errors: 'x' at end often should be 'r' (e.g., "teachex" -> "teacher")
-                    occupation = re.sub(r'([a-z]+)x\b', r'\1r', occupation, flags=re.IGNORECASE)
+                    occupation = _OCCUPATION_X_SUFFIX_RE.sub(r'\1r', occupation)
                     # Fix 'es' -> 'er' for occupations (e.g., "teaches" -> "teacher")
-                    occupation = re.sub(r'([a-z]+)es\b', r'\1er', occupation, flags=re.IGNORECASE)
+                    occupation = _OCCUPATION_ES_SUFFIX_RE.sub(r'\1er', occupation)
                     # Capitalize properly (first letter uppercase)
                     occupation = occupation.capitalize()
                     return normalize_text(occupation)
@@ -1017,125 +1453,163 @@ def extract_occupation(text: str) -> Optional[str]:
         return None
 
 
-def extract_address(text: str, phone_number: Optional[str] = None, email: Optional[str] = None) -> Optional[str]:
-    """Extract address (multi-line) from text with improved patterns. Handles Address Line1 and Line2."""
+def _search_address_line(pattern, text: str, label_starts: List[int]):
+    """
+    Same result as pattern.search(text, label_starts[0]) for an address line pattern.
+    With stdlib re, a failed search retries the lazy value group from every later
+    label on the line, which is quadratic in label-heavy OCR text. A failed label has
+    already tried every terminator up to the next newline or colon, so later labels
+    before that point cannot match either, except the last one: its separator run may
+    cross the break.
+    """
+    prefix = _ADDRESS_LINE_PREFIXES.get(pattern)
+    if prefix is None:
+        return pattern.search(text, label_starts[0])
+    tried_until = -1
+    for i, start in enumerate(label_starts):
+        if start < tried_until and i + 1 < len(label_starts) and label_starts[i + 1] < tried_until:
+            continue
+        match = pattern.match(text, start)
+        if match:
+            return match
+        label = prefix.match(text, start)
+        if label:
+            value_break = _VALUE_BREAK_RE.search(text, label.end())
+            tried_until = value_break.start() if value_break else len(text)
+    return None
+
+
+def extract_address(text: str, phone_number: Optional[str] = None, email: Optional[str] = None) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Extract address (multi-line) from text with improved patterns. Handles Address Line1 and Line2.
+    
+    Returns:
+        Dict with 'full', 'line1' and 'line2' keys (lines are only set when the
+        document labels them explicitly), or None if no address was found
+    """
     try:
-        logger.info(f"[ADDRESS] Extracting from text: {text[:300]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[ADDRESS] Extracting from text: %s", text[:300])
         
         # Remove phone and email from text to avoid capturing them in address
         text_for_address = text
         if phone_number:
-            phone_clean = re.sub(r'[-.\s()]', '', phone_number)
-            text_for_address = re.sub(re.escape(phone_number), '', text_for_address)
-            text_for_address = re.sub(re.escape(phone_clean), '', text_for_address)
+            phone_clean = _PHONE_SEPARATORS_RE.sub('', phone_number)
+            text_for_address = text_for_address.replace(phone_number, '')
+            text_for_address = text_for_address.replace(phone_clean, '')
         if email:
-            text_for_address = re.sub(re.escape(email), '', text_for_address)
+            text_for_address = text_for_address.replace(email, '')
         
         # First, try to extract Address Line1 and Line2 separately
         # Handle OCR errors like "Adebress Linet", "Aderess Linet", "Address Linet" instead of "Address Line1"
-        address_line1_patterns = [
-            r'(?:address\s+line\s*1|address\s+linet|adebress\s+linet|aderess\s+linet|address\s+linet1)[:\s]+([^\n:]+?)(?:\s+Address\s+Line\s*2|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)',
-            r'(?:address\s+line\s*1|address\s+linet)[:\s]+([^\n:]+?)(?:\n|Address\s+Line\s*2|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)',
-        ]
+        # No match can start before the first "Address Line" label, so the searches start there
         address_line1_match = None
-        for pattern in address_line1_patterns:
-            address_line1_match = re.search(pattern, text_for_address, re.IGNORECASE)
-            if address_line1_match:
-                break
-        
-        address_line2_patterns = [
-            r'(?:address\s+line\s*2|address\s+linet2)[:\s]+([^\n:]+?)(?:\s+City|State|Country|Pin|Phone|Email|Mobile|Tel|$)',
-            r'(?:address\s+line\s*2)[:\s]+([^\n:]+?)(?:\n|City|State|Country|Pin|Phone|Email|Mobile|Tel|$)',
-        ]
         address_line2_match = None
-        for pattern in address_line2_patterns:
-            address_line2_match = re.search(pattern, text_for_address, re.IGNORECASE)
-            if address_line2_match:
-                break
+        label_starts = [label.start() for label in _ADDRESS_LINE_LABEL_RE.finditer(text_for_address)]
+        if label_starts:
+            for pattern in _compiled_patterns['address_line1']:
+                address_line1_match = _search_address_line(pattern, text_for_address, label_starts)
+                if address_line1_match:
+                    break
+            for pattern in _compiled_patterns['address_line2']:
+                address_line2_match = _search_address_line(pattern, text_for_address, label_starts)
+                if address_line2_match:
+                    break
         
         address_parts = []
+        line1 = None
+        line2 = None
         if address_line1_match:
             addr1 = address_line1_match.group(1).strip()
             # Clean up OCR errors and trailing fields
-            addr1 = re.sub(r'\s+(Address\s+Line\s*2|City|State|Country|Pin|Phone|Email|Mobile|Tel).*$', '', addr1, flags=re.IGNORECASE)
+            addr1 = _truncate_at_labels(_ADDRESS_LINE2_LABEL_RE.split(addr1, 1)[0], 'address_line1')
             # Remove phone numbers and emails that might have been captured
-            addr1 = re.sub(r'\d{7,15}', '', addr1)  # Remove phone-like numbers
-            addr1 = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', addr1)  # Remove emails
+            addr1 = _PHONE_LIKE_RE.sub('', addr1)  # Remove phone-like numbers
+            addr1 = _EMAIL_STRIP_RE.sub('', addr1)  # Remove emails
             if addr1 and len(addr1.strip()) > 3:
-                address_parts.append(addr1.strip())
-                logger.info(f"[ADDRESS] Line1: {addr1}")
+                line1 = addr1.strip()
+                address_parts.append(line1)
+                logger.info("[ADDRESS] Line1: %s", addr1)
         
         if address_line2_match:
             addr2 = address_line2_match.group(1).strip()
             # Clean up trailing fields
-            addr2 = re.sub(r'\s+(City|State|Country|Pin|Code|Phone|Email|Mobile|Tel).*$', '', addr2, flags=re.IGNORECASE)
+            addr2 = _truncate_at_labels(addr2, 'address_line2')
             # Remove phone numbers and emails
-            addr2 = re.sub(r'\d{7,15}', '', addr2)
-            addr2 = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', addr2)
+            addr2 = _PHONE_LIKE_RE.sub('', addr2)
+            addr2 = _EMAIL_STRIP_RE.sub('', addr2)
             if addr2 and len(addr2.strip()) > 3:
-                address_parts.append(addr2.strip())
-                logger.info(f"[ADDRESS] Line2: {addr2}")
+                line2 = addr2.strip()
+                address_parts.append(line2)
+                logger.info("[ADDRESS] Line2: %s", addr2)
         
         if address_parts:
             full_address = ', '.join(address_parts)
-            logger.info(f"[ADDRESS] Extracted full address: {full_address}")
-            return normalize_text(full_address)
+            logger.info("[ADDRESS] Extracted full address: %s", full_address)
+            return {
+                "full": normalize_text(full_address),
+                "line1": normalize_text(line1) if line1 else None,
+                "line2": normalize_text(line2) if line2 else None
+            }
         
         # Enhanced address patterns - be more specific to stop at next field
-        patterns = [
-            # With labels - stop at City/State/Country/Pin/Phone/Email/Mobile (most specific)
-            r'(?:address|residence|location|addr\.?)[:\s]+([^\n:]+?)(?:\s+(?:City|State|Country|Pin|Phone|Email|Mobile|Tel|Mobile\s+Numb|Occupation|Date|Birth|Emailld)|$)',
-            
-            # Street address pattern - stop at City/State/Country/Mobile/Email
-            r'(\d+\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s+(?:Street|St|Avenue|Ave|Road|Rd|Lane|Ln|Drive|Dr|Boulevard|Blvd|Way|Circle|Ct|Court|Parkway|Pkwy|Place|Pl))(?:\s+(?:City|State|Country|Pin|Phone|Email|Mobile|Tel|Mobile\s+Numb|Emailld)|$)',
-            
-            # With labels - multi-line version (stop at phone/email keywords)
-            r'(?:address|residence|location|addr\.?)[:\s\-]+(.+?)(?:\n\n|\n(?:phone|email|mobile|tel|mobile\s+numb|emailld|name|age|gender|contact|occupation|date|birth)|$)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text_for_address, re.IGNORECASE | re.MULTILINE)
+        # The labelled patterns start at the first address label; the street pattern needs a digit
+        address_label = _ADDRESS_LABEL_RE.search(text_for_address)
+        street_anchor = _DIGIT_RE.search(text_for_address)
+        for pattern, anchor in zip(_compiled_patterns['address'], (address_label, street_anchor, address_label)):
+            match = pattern.search(text_for_address, anchor.start()) if anchor else None
             if match:
                 addr = match.group(1).strip()
                 # Clean up - remove any trailing field labels
-                addr = re.sub(r'\s+(City|State|Country|Phone|Email|Name|Age|Gender|Mobile|Tel|Occupation|Date|Birth).*$', '', addr, flags=re.IGNORECASE)
+                addr = _truncate_at_labels(addr, 'address')
                 # Remove email addresses that might have been captured
-                addr = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', addr)
+                addr = _EMAIL_STRIP_RE.sub('', addr)
                 # Remove phone numbers (7-15 digits)
-                addr = re.sub(r'\b\d{7,15}\b', '', addr)
+                addr = _PHONE_LIKE_WORD_RE.sub('', addr)
                 addr = addr.strip()
                 # Clean up multiple newlines
-                addr = re.sub(r'\n+', ' ', addr)  # Convert newlines to spaces for single-line addresses
+                addr = _NEWLINES_RE.sub(' ', addr)  # Convert newlines to spaces for single-line addresses
                 # Remove extra whitespace
-                addr = re.sub(r'\s+', ' ', addr)
+                addr = _WHITESPACE_RE.sub(' ', addr)
                 # Validate: should be longer than 5 chars, not start with "email", and not be just numbers
                 if len(addr) > 5 and not addr.lower().startswith('email') and not addr.replace(' ', '').isdigit():
-                    return normalize_text(addr[:200])  # Limit length
+                    return {"full": normalize_text(addr[:200]), "line1": None, "line2": None}  # Limit length
         
         # Fallback: look for lines with numbers and street names
-        lines = text_for_address.split('\n')
+        # A line qualifies when a street word follows its first digit, so each line is
+        # checked with one digit search and one literal scan up to its end
         address_lines = []
-        for i, line in enumerate(lines):
-            # Check if line contains address-like content (but not phone/email)
-            if re.search(r'\d+.*(?:street|st|avenue|ave|road|rd|lane|ln|drive|dr|address|addr)', line, re.IGNORECASE):
-                # Skip if it contains phone or email
-                if not re.search(r'\d{7,15}|@', line):
-                    # Collect this line and next 2-3 lines (but stop if we hit phone/email)
-                    for j in range(i, min(i+4, len(lines))):
-                        check_line = lines[j]
-                        if re.search(r'\d{7,15}|@', check_line):
-                            break
-                        address_lines.append(check_line)
+        pos = 0
+        while True:
+            digit = _DIGIT_RE.search(text_for_address, pos)
+            if not digit:
+                break
+            line_start = text_for_address.rfind('\n', 0, digit.start()) + 1
+            line_end = text_for_address.find('\n', digit.end())
+            if line_end == -1:
+                line_end = len(text_for_address)
+            if not _STREET_HINT_RE.search(text_for_address, digit.end(), line_end):
+                pos = line_end + 1
+                continue
+            # Skip if it contains phone or email
+            if _PHONE_OR_EMAIL_RE.search(text_for_address, line_start, line_end):
+                pos = line_end + 1
+                continue
+            # Collect this line and next 2-3 lines (but stop if we hit phone/email)
+            for check_line in text_for_address[line_start:].split('\n', 4)[:4]:
+                if _PHONE_OR_EMAIL_RE.search(check_line):
                     break
+                address_lines.append(check_line)
+            break
         
         if address_lines:
             addr = '\n'.join([l.strip() for l in address_lines if l.strip()])
             # Clean up phone and email from address
-            addr = re.sub(r'\d{7,15}', '', addr)
-            addr = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', addr)
-            addr = re.sub(r'\s+', ' ', addr).strip()
+            addr = _PHONE_LIKE_RE.sub('', addr)
+            addr = _EMAIL_STRIP_RE.sub('', addr)
+            addr = _WHITESPACE_RE.sub(' ', addr).strip()
             if len(addr) > 5:
-                return normalize_text(addr)
+                return {"full": normalize_text(addr), "line1": None, "line2": None}
         
         return None
     except Exception as e:
@@ -1157,19 +1631,6 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
     dynamic_fields = {}
     
     try:
-        # Enhanced patterns to catch ANY field format
-        # Pattern 1: "Label: Value" format (most common)
-        label_colon_pattern = re.compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
-        
-        # Pattern 2: "Label Value" format (without colon)
-        label_space_pattern = re.compile(r'^([a-zA-Z][a-zA-Z\s]{2,40}?)\s+([A-Z0-9@a-z].+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
-        
-        # Pattern 3: "Label - Value" format
-        label_dash_pattern = re.compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)\s*-\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
-        
-        # Pattern 4: "Label. Value" format
-        label_dot_pattern = re.compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)\s*\.\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
-        
         # Split text into lines for better parsing
         lines = text.split('\n')
         
@@ -1181,7 +1642,7 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
             
             match = None
             # Try all patterns
-            for pattern in [label_colon_pattern, label_space_pattern, label_dash_pattern, label_dot_pattern]:
+            for pattern in _DYNAMIC_LABEL_PATTERNS:
                 match = pattern.match(line)
                 if match:
                     break
@@ -1205,70 +1666,16 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
                 # Normalize label name to create field key
                 field_name = label.lower().strip()
                 # Fix common OCR errors in labels
-                field_name = re.sub(r'\s+', '_', field_name)  # Replace spaces with underscore
-                field_name = re.sub(r'[^\w]', '', field_name)  # Remove special chars
+                field_name = _WHITESPACE_RE.sub('_', field_name)  # Replace spaces with underscore
+                field_name = _NON_WORD_RE.sub('', field_name)  # Remove special chars
                 
                 # Keep original field name for unknown fields (don't force mapping)
                 original_field_name = field_name
                 
-                # Map common OCR errors and variations to standard field names
-                field_mapping = {
-                    'neme': 'name',
-                    'mame': 'name',
-                    'norme': 'name',
-                    'full_name': 'name',
-                    'applicant_name': 'name',
-                    'date_of_birth': 'date_of_birth',
-                    'dateofbirth': 'date_of_birth',
-                    'dateofbisth': 'date_of_birth',
-                    'datestbisth': 'date_of_birth',
-                    'date_st_bisth': 'date_of_birth',
-                    'dob': 'date_of_birth',
-                    'birth_date': 'date_of_birth',
-                    'parents_name': 'parents_name',
-                    'parentsname': 'parents_name',
-                    'parentsame': 'parents_name',
-                    'parentname': 'parents_name',
-                    'parent_name': 'parents_name',
-                    'occupation': 'occupation',
-                    'ocupation': 'occupation',
-                    'profession': 'occupation',
-                    'job': 'occupation',
-                    'phone': 'phone',
-                    'phone_number': 'phone',
-                    'phonenumber': 'phone',
-                    'mobile': 'phone',
-                    'mobile_number': 'phone',
-                    'mobilenumber': 'phone',
-                    'mobilenumbes': 'phone',
-                    'mobilenumb': 'phone',
-                    'contact': 'phone',
-                    'email': 'email',
-                    'email_id': 'email',
-                    'emailid': 'email',
-                    'emailld': 'email',
-                    'e_mail': 'email',
-                    'e-mail': 'email',
-                    'address': 'address',
-                    'addr': 'address',
-                    'residence': 'address',
-                    'location': 'address',
-                    'pin_code': 'pin_code',
-                    'pincode': 'pin_code',
-                    'zip_code': 'pin_code',
-                    'postal_code': 'pin_code',
-                    'city': 'city',
-                    'state': 'state',
-                    'country': 'country',
-                    'age': 'age',
-                    'gender': 'gender',
-                    'sex': 'gender',
-                }
-                
                 # Apply mapping for known fields, but keep original for unknown fields
                 mapped_field_name = None
-                if field_name in field_mapping:
-                    mapped_field_name = field_mapping[field_name]
+                if field_name in _DYNAMIC_FIELD_MAPPING:
+                    mapped_field_name = _DYNAMIC_FIELD_MAPPING[field_name]
                 elif field_name.endswith('_name') and 'parent' in field_name:
                     mapped_field_name = 'parents_name'
                 elif 'phone' in field_name or 'mobile' in field_name or 'contact' in field_name:
@@ -1290,22 +1697,22 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
                 
                 # Generic cleanup: remove label words that might be captured in value
                 # Remove common label words from the start of value (OCR might capture them)
-                value = re.sub(r'^(?:phone|mobile|tel|contact|ph|number|numbes|numb|num|email|mail|emailld|emailid|address|addr|name|neme|mame|occupation|ocupation|job|date|birth|bisth|biosth|parents|parent|ame)\s*[:\-]?\s*', '', value, flags=re.IGNORECASE)
+                value = _DYNAMIC_LABEL_PREFIX_RE.sub('', value)
                 
                 # Remove trailing labels that might be captured
-                value = re.sub(r'\s+(Phone|Email|Address|Age|Gender|Mobile|Date|Birth|Occupation|Name|Parents|City|State|Country|Pin|Number|Id|ID|Code).*$', '', value, flags=re.IGNORECASE)
+                value = _truncate_at_labels(value, 'dynamic')
                 value = value.strip()
                 
                 # Special handling for date field - check if it contains birth date info
                 if 'date' in field_name.lower() and ('birth' in value.lower() or 'bisth' in value.lower() or 'biosth' in value.lower()):
                     field_name = 'date_of_birth'
                     # Extract just the date part, remove "St Biosth" etc.
-                    date_match = re.search(r'(\d{1,2}[/.\-lI]\d{1,2}[/.\-lI]\d{2,4})', value)
+                    date_match = _DATE_VALUE_RE.search(value)
                     if date_match:
                         value = date_match.group(1)
                 
                 # Clean value - remove trailing labels
-                value = re.sub(r'\s+(Phone|Email|Address|Age|Gender|Mobile|Date|Birth|Occupation|Name|Parents|City|State|Country|Pin|Number|Id|ID|Code).*$', '', value, flags=re.IGNORECASE)
+                value = _truncate_at_labels(value, 'dynamic')
                 value = value.strip()
                 
                 # Only add if value is meaningful
@@ -1313,31 +1720,30 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
                     # If field already exists, keep the longer/more complete value
                     if final_field_name not in dynamic_fields or len(value) > len(dynamic_fields[final_field_name]):
                         dynamic_fields[final_field_name] = value
-                        logger.debug(f"[DYNAMIC] Extracted field: {final_field_name} = {value[:50]}")
+                        logger.debug("[DYNAMIC] Extracted field: %s = %s", final_field_name, value[:50])
         
         # Also try to extract fields from multi-line patterns (for fields that span multiple lines)
         # Look for patterns like "Field Name:\nValue Line 1\nValue Line 2"
-        multiline_pattern = re.compile(r'^([a-zA-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+\n(.+?)(?=\n(?:[A-Z][a-zA-Z\s]{1,40}?)[:\s\-\.]+|\n*$)', re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        multiline_matches = multiline_pattern.finditer(text)
+        multiline_matches = _LABEL_MULTILINE_RE.finditer(text)
         for match in multiline_matches:
             label = match.group(1).strip()
             value = match.group(2).strip()
             
             if len(value) > 1 and len(label) >= 2:
                 field_name = label.lower().strip()
-                field_name = re.sub(r'\s+', '_', field_name)
-                field_name = re.sub(r'[^\w]', '', field_name)
+                field_name = _WHITESPACE_RE.sub('_', field_name)
+                field_name = _NON_WORD_RE.sub('', field_name)
                 
                 # Clean multi-line value
-                value = re.sub(r'\n+', ' ', value)  # Convert newlines to spaces
-                value = re.sub(r'\s+', ' ', value).strip()  # Normalize whitespace
+                value = _NEWLINES_RE.sub(' ', value)  # Convert newlines to spaces
+                value = _WHITESPACE_RE.sub(' ', value).strip()  # Normalize whitespace
                 
                 if len(value) > 1:
                     if field_name not in dynamic_fields or len(value) > len(dynamic_fields[field_name]):
                         dynamic_fields[field_name] = value
-                        logger.debug(f"[DYNAMIC] Extracted multi-line field: {field_name} = {value[:50]}")
+                        logger.debug("[DYNAMIC] Extracted multi-line field: %s = %s", field_name, value[:50])
         
-        logger.info(f"[DYNAMIC] Extracted {len(dynamic_fields)} dynamic fields: {list(dynamic_fields.keys())}")
+        logger.info("[DYNAMIC] Extracted %s dynamic fields: %s", len(dynamic_fields), list(dynamic_fields.keys()))
         return dynamic_fields
         
     except Exception as e:
@@ -1345,6 +1751,20 @@ def extract_dynamic_fields(text: str) -> Dict[str, str]:
         return {}
 
 
+# Form fields sit well within the first pages of OCR text; longer input (e.g. a long
+# multi-page PDF) is cut at a line break so every pattern sees a bounded subject
+_MAX_FIELD_TEXT_LEN = 16384
+
+
+def _empty_result(language: Optional[str] = None) -> Dict:
+    """Result returned when no fields could be extracted (fresh dicts on every call)."""
+    return {
+        "fields": {},  # Empty dict - no fields extracted
+        "confidence_scores": {},
+        "language_detected": language or 'en'
+    }
+
+
 def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, Optional[str]]:
     """
     Extract all fields from OCR text with multilingual support.
@@ -1358,27 +1778,39 @@ def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, O
     """
     if not text:
         logger.warning("Empty text provided for field extraction")
-        return {
-            "fields": {},  # Empty dict - no fields extracted
-            "confidence_scores": {},
-            "language_detected": language or 'en'
-        }
+        return _empty_result(language)
+    
+    if len(text) > _MAX_FIELD_TEXT_LEN:
+        logger.info("Field extraction limited to the first %d of %d characters", _MAX_FIELD_TEXT_LEN, len(text))
+        cut = text.rfind('\n', 0, _MAX_FIELD_TEXT_LEN)
+        text = text[:cut if cut > 0 else _MAX_FIELD_TEXT_LEN]
     
     try:
         # Fast language detection - only if not provided, and use small sample
         if not language:
             # Use only first 100 chars for faster detection
-            language = detect_language(text[:100] if len(text) > 100 else text, sample_size=100)
+            language = _detect_language(text[:100] if len(text) > 100 else text)
         
         # IMPORTANT: Extract from both normalized AND original text
         # Normalized text helps with OCR errors, but original preserves structure
         normalized_text = normalize_text(text)
         
+        # One cheap scan each decides which extractors can match at all: phone, age,
+        # DOB, PIN, Aadhaar and PAN patterns all need a digit and every email pattern
+        # needs an '@'. Normalization never introduces either, so the raw text decides.
+        has_digit = _DIGIT_RE.search(text) is not None
+        has_at = '@' in text
+        # Likewise parents' name and occupation only match after their label, and a
+        # passport number needs either its label or a digit
+        keywords = {match.lastgroup for match in _FIELD_KEYWORD_RE.finditer(text)}
+        # With RE2, one set match per text copy rules out fields none of whose patterns match
+        ruled_out = _fields_ruled_out(normalized_text, text)
+        
         # Extract standard fields with multilingual patterns
         # Extract phone and email first, as they're needed for other extractions
         # Try both normalized and original text for better extraction
-        phone_number = extract_phone(normalized_text) or extract_phone(text)
-        email_address = extract_email(normalized_text) or extract_email(text)
+        phone_number = (extract_phone(normalized_text) or extract_phone(text)) if has_digit and 'phone' not in ruled_out else None
+        email_address = (extract_email(normalized_text) or extract_email(text)) if has_at and 'email' not in ruled_out else None
         
         # Extract full name first
         full_name = extract_name(normalized_text, language) or extract_name(text, language)
@@ -1388,29 +1820,32 @@ def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, O
         if full_name:
             name_components = parse_name_components(full_name)
         
+        # Address extraction also yields the labelled Line1/Line2 values, if any
+        address_info = extract_address(normalized_text, phone_number=phone_number, email=email_address) or extract_address(text, phone_number=phone_number, email=email_address)
+        
         # Extract fields - try both normalized and original text for maximum coverage
         fields = {
             "name": full_name,  # Full name
             "first_name": name_components.get("first_name"),
             "middle_name": name_components.get("middle_name"),
             "last_name": name_components.get("last_name"),
-            "age": extract_age(normalized_text) or extract_age(text),
-            "gender": extract_gender(normalized_text) or extract_gender(text),
+            "age": (extract_age(normalized_text) or extract_age(text)) if has_digit and 'age' not in ruled_out else None,
+            "gender": (extract_gender(normalized_text) or extract_gender(text)) if 'gender' not in ruled_out else None,
             "phone": phone_number,
             "email": email_address,
-            "address": extract_address(normalized_text, phone_number=phone_number, email=email_address) or extract_address(text, phone_number=phone_number, email=email_address)
+            "address": address_info["full"] if address_info else None
         }
         
         # Extract additional common fields (PIN code needs phone to exclude it)
         # Try both normalized and original text
         additional_fields = {
-            "date_of_birth": extract_date_of_birth(normalized_text) or extract_date_of_birth(text),
-            "parents_name": extract_parents_name(normalized_text) or extract_parents_name(text),
-            "occupation": extract_occupation(normalized_text) or extract_occupation(text),
-            "pin_code": extract_pin_code(normalized_text, phone_number=phone_number) or extract_pin_code(text, phone_number=phone_number),
-            "aadhaar": extract_aadhaar(normalized_text) or extract_aadhaar(text),
-            "pan": extract_pan(normalized_text) or extract_pan(text),
-            "passport": extract_passport(normalized_text) or extract_passport(text)
+            "date_of_birth": (extract_date_of_birth(normalized_text) or extract_date_of_birth(text)) if has_digit and 'date_of_birth' not in ruled_out else None,
+            "parents_name": (extract_parents_name(normalized_text) or extract_parents_name(text)) if 'parents_name' in keywords and 'parents_name' not in ruled_out else None,
+            "occupation": (extract_occupation(normalized_text) or extract_occupation(text)) if 'occupation' in keywords and 'occupation' not in ruled_out else None,
+            "pin_code": (extract_pin_code(normalized_text, phone_number=phone_number) or extract_pin_code(text, phone_number=phone_number)) if has_digit else None,
+            "aadhaar": (extract_aadhaar(normalized_text) or extract_aadhaar(text)) if has_digit and 'aadhaar' not in ruled_out else None,
+            "pan": (extract_pan(normalized_text) or extract_pan(text)) if has_digit and 'pan' not in ruled_out else None,
+            "passport": (extract_passport(normalized_text) or extract_passport(text)) if (has_digit or 'passport' in keywords) and 'passport' not in ruled_out else None
         }
         
         # Merge additional fields into main fields dict
@@ -1438,71 +1873,60 @@ def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, O
                     # Keep the longer/more complete value
                     if len(cleaned_value) > len(existing_value):
                         fields[field_name] = cleaned_value
-                        logger.info(f"[DYNAMIC] Updated field {field_name} with better value")
+                        logger.info("[DYNAMIC] Updated field %s with better value", field_name)
                 else:
                     # Field doesn't exist, add it (EVEN IF IT'S NOT A PREDEFINED FIELD)
                     # This ensures ALL fields from the document are extracted, not just known ones
                     fields[field_name] = cleaned_value
-                    logger.info(f"[DYNAMIC] Added field: {field_name} = {cleaned_value[:50]}")
+                    logger.info("[DYNAMIC] Added field: %s = %s", field_name, cleaned_value[:50])
+        
+        # Labelled Address Line1/Line2 found by extract_address take precedence; splitting
+        # the address only fills in lines the document did not label
+        line1 = address_info["line1"] if address_info else None
+        line2 = address_info["line2"] if address_info else None
         
         # Parse address into components if available
         address = fields.get("address")
         if address:
             # Clean address - remove email if it got captured
-            address = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', address)
-            address = re.sub(r'\s+', ' ', address).strip()
+            if '@' in address:
+                address = _EMAIL_STRIP_RE.sub('', address)
+            address = ' '.join(address.split())
             fields["address"] = address if address else None
             
-            # Try to split address by comma or newline
-            if ',' in address:
-                address_lines = [a.strip() for a in address.split(',')]
-            else:
-                address_lines = address.split('\n')
-            
-            fields["address_line1"] = address_lines[0] if len(address_lines) > 0 and address_lines[0] else None
-            fields["address_line2"] = address_lines[1] if len(address_lines) > 1 and address_lines[1] else None
-        
-        # Also try to extract Address Line1 and Line2 directly from text if not already set
-        if not fields.get("address_line1") or not fields.get("address_line2"):
-            # Use original text (before normalization) to extract address lines
-            address_line1_match = re.search(r'(?:address\s+line\s*1|address\s+linet|adebress\s+linet)[:\s]+([^\n:]+?)(?:\s+Address\s+Line\s*2|City|State|Country|$)', text, re.IGNORECASE)
-            address_line2_match = re.search(r'(?:address\s+line\s*2)[:\s]+([^\n:]+?)(?:\s+City|State|Country|Pin|Phone|Email|$)', text, re.IGNORECASE)
-            
-            if address_line1_match and not fields.get("address_line1"):
-                addr1 = address_line1_match.group(1).strip()
-                addr1 = re.sub(r'\s+(Address\s+Line\s*2|City|State|Country|Pin|Phone|Email).*$', '', addr1, flags=re.IGNORECASE)
-                fields["address_line1"] = normalize_text(addr1) if addr1 else None
-            
-            if address_line2_match and not fields.get("address_line2"):
-                addr2 = address_line2_match.group(1).strip()
-                addr2 = re.sub(r'\s+(City|State|Country|Pin|Code|Phone|Email).*$', '', addr2, flags=re.IGNORECASE)
-                fields["address_line2"] = normalize_text(addr2) if addr2 else None
+            # Try to split address by comma (whitespace is collapsed above, so no newlines remain)
+            if not (line1 and line2):
+                if ',' in address:
+                    address_lines = [a.strip() for a in address.split(',', 2)]
+                    line1 = line1 or address_lines[0] or None
+                    line2 = line2 or address_lines[1] or None
+                else:
+                    line1 = line1 or address or None
+                    line2 = line2 or None
+            fields["address_line1"] = line1
+            fields["address_line2"] = line2
+        else:
+            if line1:
+                fields["address_line1"] = line1
+            if line2:
+                fields["address_line2"] = line2
         
         # Extract city, state, country from the original normalized text (not from address field)
-        # Look for "City: X" pattern - stop at State, Pin Code, or Phone
-        city_match = re.search(r'(?:city|city\s*:)[:\s]+([A-Z][a-zA-Z]+)(?:\s+(?:State|Pin|Phone|Email|Code)|$)', normalized_text, re.IGNORECASE)
-        if city_match:
-            city = city_match.group(1).strip()
-            # Remove any trailing state/country names
-            city = re.sub(r'\s+(State|Country|Pin|Code|Phone|Email).*$', '', city, flags=re.IGNORECASE)
-            fields["city"] = city.strip()
-            logger.info(f"[CITY] Extracted: {fields['city']}")
-        
-        # Look for "State: X" pattern - stop at Pin Code, Phone, or Email
-        state_match = re.search(r'(?:state|state\s*:)[:\s]+([A-Z][a-zA-Z]+)(?:\s+(?:Pin|Phone|Email|Code|Country)|$)', normalized_text, re.IGNORECASE)
-        if state_match:
-            state = state_match.group(1).strip()
-            # Remove any trailing pin code or other fields
-            state = re.sub(r'\s+(Pin|Code|Phone|Email|Country).*$', '', state, flags=re.IGNORECASE)
-            fields["state"] = state.strip()
-            logger.info(f"[STATE] Extracted: {fields['state']}")
-        
-        # Look for "Country: X" pattern
-        country_match = re.search(r'(?:country|country\s*:)[:\s]+([A-Z][a-zA-Z]+)(?:\s+(?:Pin|Phone|Email|Code|State)|$)', normalized_text, re.IGNORECASE)
-        if country_match:
-            country = country_match.group(1).strip()
-            fields["country"] = country.strip()
-            logger.info(f"[COUNTRY] Extracted: {fields['country']}")
+        # Single pass over the text - the first "City: X", "State: X" and "Country: X" win
+        # Most documents carry none of the labels; for ASCII text (where str.lower agrees with
+        # re's case folding) a substring check rules that out far faster than the regex scan
+        lowered = normalized_text.lower() if normalized_text.isascii() else None
+        has_location = lowered is None or 'city' in lowered or 'state' in lowered or 'country' in lowered
+        location_found = set()
+        for match in _CITY_STATE_COUNTRY_RE.finditer(normalized_text) if has_location else ():
+            tag = match.group('label').lower()
+            if tag in location_found:
+                continue
+            location_found.add(tag)
+            fields[tag] = match.group('value').strip()
+            logger.info("[%s] Extracted: %s", tag.upper(), fields[tag])
+            if len(location_found) == 3:
+                break
         
         # Clean all extracted field values for accuracy and correctness
         cleaned_fields = {}
@@ -1535,18 +1959,15 @@ def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, O
         extracted_fields = {k: v for k, v in cleaned_fields.items() if v is not None and v != ""}
         
         # Calculate confidence scores only for extracted fields
-        confidence_scores = {}
-        for field_name, field_value in extracted_fields.items():
-            # Basic confidence: 0.8 if found, can be enhanced with actual OCR confidence
-            confidence_scores[field_name] = 0.8
+        # Basic confidence: 0.8 if found, can be enhanced with actual OCR confidence
+        confidence_scores = {field_name: 0.8 for field_name in extracted_fields}
         
         # Log extraction results
-        extracted = list(extracted_fields.keys())
-        logger.info(f"Extracted fields: {', '.join(extracted) if extracted else 'none'}")
+        logger.info("Extracted fields: %s", ', '.join(extracted_fields) or 'none')
         
         # Log what was extracted for debugging
         for field_name, field_value in extracted_fields.items():
-            logger.info(f"[FIELD] {field_name}: {field_value}")
+            logger.info("[FIELD] %s: %s", field_name, field_value)
         
         return {
             "fields": extracted_fields,  # Only return fields that were actually extracted
@@ -1557,8 +1978,4 @@ def extract_all_fields(text: str, language: Optional[str] = None) -> Dict[str, O
     except Exception as e:
         logger.error(f"Field extraction failed: {e}", exc_info=True)
         # Return empty fields on error (no fields extracted)
-        return {
-            "fields": {},  # Empty dict - no fields extracted
-            "confidence_scores": {},
-            "language_detected": language or 'en'
-        }
+        return _empty_result(language)
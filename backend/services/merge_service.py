@@ -38,16 +38,16 @@ def merge_results(
     if fallback_fields:
         logger.info("Using fallback results (low TrOCR confidence)")
         # Merge: prefer fallback for empty/missing fields
+        # Bound lookups, and the fallback is only fetched for fields that need it
+        fallback_get = fallback_fields.get
+        confidence_get = field_confidences.get if field_confidences else None
         merged = {}
-        for key in trocr_fields.keys():
-            trocr_val = trocr_fields.get(key)
-            fallback_val = fallback_fields.get(key)
-            
+        for key, trocr_val in trocr_fields.items():
             # Use fallback if TrOCR is empty or confidence is low
             if not trocr_val or trocr_val.strip() == "":
-                merged[key] = fallback_val
-            elif field_confidences and field_confidences.get(key, 0) < 0.65:
-                merged[key] = fallback_val if fallback_val else trocr_val
+                merged[key] = fallback_get(key)
+            elif confidence_get is not None and confidence_get(key, 0) < 0.65:
+                merged[key] = fallback_get(key) or trocr_val
             else:
                 merged[key] = trocr_val
         
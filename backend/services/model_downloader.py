@@ -4,15 +4,10 @@ Downloads models from Hugging Face Hub on first request if not present locally.
 """
 
 import os
-import sys
 from pathlib import Path
 from typing import Optional
 import logging
-from huggingface_hub import snapshot_download
-import torch
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
 
 logger = setup_logger("model_downloader")
@@ -31,9 +26,18 @@ MODELS = {
 
 BACKEND_DIR = Path(__file__).parent.parent.resolve()
 
+# Models confirmed present (found or downloaded) in this process; never rechecked
+_available_models = set()
+
+# Written into a model directory once its download has completed
+READY_MARKER = ".ready"
+
 
 def check_model_exists(model_path: Path) -> bool:
     """Check if model exists locally."""
+    # A completed download leaves a marker, so one stat answers for it across restarts
+    if (model_path / READY_MARKER).exists():
+        return True
     if not model_path.exists():
         return False
     # Check for required files
@@ -54,6 +58,9 @@ def download_model_from_hf(hf_name: str, local_path: Path, model_key: str) -> bo
         True if successful, False otherwise
     """
     try:
+        # Imported here: most processes find their models on disk and never download
+        from huggingface_hub import snapshot_download
+        
         logger.info(f"[DOWNLOAD] Starting download of {model_key} from Hugging Face...")
         logger.info(f"[DOWNLOAD] Model: {hf_name}")
         logger.info(f"[DOWNLOAD] Destination: {local_path}")
@@ -68,6 +75,7 @@ def download_model_from_hf(hf_name: str, local_path: Path, model_key: str) -> bo
             local_dir_use_symlinks=False,
             resume_download=True  # Resume if interrupted
         )
+        (local_path / READY_MARKER).write_text(hf_name)
         
         logger.info(f"[DOWNLOAD] ✅ Successfully downloaded {model_key}")
         return True
@@ -87,6 +95,9 @@ def ensure_model_available(model_key: str) -> bool:
     Returns:
         True if model is available, False otherwise
     """
+    if model_key in _available_models:
+        return True
+    
     if model_key not in MODELS:
         logger.error(f"Unknown model key: {model_key}")
         return False
@@ -97,15 +108,19 @@ def ensure_model_available(model_key: str) -> bool:
     # Check if model exists
     if check_model_exists(local_path):
         logger.info(f"[MODEL] {model_key} already exists locally")
+        _available_models.add(model_key)
         return True
     
     # Download model
     logger.warning(f"[MODEL] {model_key} not found locally, downloading...")
-    return download_model_from_hf(
+    if download_model_from_hf(
         model_config["hf_name"],
         local_path,
         model_key
-    )
+    ):
+        _available_models.add(model_key)
+        return True
+    return False
 
 
 def ensure_all_models_available() -> dict:
@@ -128,10 +143,17 @@ def get_model_size_mb(model_path: Path) -> float:
     if not model_path.exists():
         return 0.0
     
+    # Walk with os.scandir (like rglob, not into directory symlinks): entries carry their
+    # type, so only files are stat'ed
     total_size = 0
-    for file_path in model_path.rglob("*"):
-        if file_path.is_file():
-            total_size += file_path.stat().st_size
+    pending = [str(model_path)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total_size += entry.stat().st_size
     
     return total_size / (1024 * 1024)
 
@@ -8,11 +8,7 @@ from PIL import Image
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import os
-import sys
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
 
 logger = setup_logger("paddleocr_service")
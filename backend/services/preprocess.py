@@ -10,11 +10,7 @@ from PIL import Image
 import base64
 from io import BytesIO
 from typing import Tuple, Dict
-import sys
-import os
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
 
 logger = setup_logger("preprocess")
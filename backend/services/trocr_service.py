@@ -9,11 +9,7 @@ from PIL import Image
 import numpy as np
 from typing import Dict, Optional
 from pathlib import Path
-import os
-import sys
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
 
 logger = setup_logger("trocr_service")
@@ -35,6 +31,9 @@ MODEL_PRINTED_PATH = BACKEND_DIR / "models" / "trocr-printed"
 def get_device() -> str:
     """Get available device (CUDA or CPU)."""
     if torch.cuda.is_available():
+        # TrOCR always feeds fixed-size (384x384) images, so cuDNN's per-shape
+        # algorithm search runs once and every later call uses the fastest kernels
+        torch.backends.cudnn.benchmark = True
         return "cuda"
     return "cpu"
 
@@ -218,7 +217,7 @@ def extract_text_from_image(
     """
     try:
         # Load model
-        logger.info(f"[DEBUG] Loading model type: {model_type}")
+        logger.debug(f"[DEBUG] Loading model type: {model_type}")
         model_data = load_trocr_model(model_type)
         if model_data is None:
             logger.error(f"[ERROR] Model {model_type} failed to load")
@@ -233,12 +232,12 @@ def extract_text_from_image(
         device = get_device()
         
         # DEBUG: Check torch and model
-        logger.info(f"[DEBUG] Torch version: {torch.__version__}")
-        logger.info(f"[DEBUG] CUDA available: {torch.cuda.is_available()}")
-        logger.info(f"[DEBUG] Device: {device}")
-        logger.info(f"[DEBUG] Model type: {type(model)}")
-        logger.info(f"[DEBUG] Processor type: {type(processor)}")
-        logger.info(f"[DEBUG] Tokenizer type: {type(tokenizer)}")
+        logger.debug(f"[DEBUG] Torch version: {torch.__version__}")
+        logger.debug(f"[DEBUG] CUDA available: {torch.cuda.is_available()}")
+        logger.debug(f"[DEBUG] Device: {device}")
+        logger.debug(f"[DEBUG] Model type: {type(model)}")
+        logger.debug(f"[DEBUG] Processor type: {type(processor)}")
+        logger.debug(f"[DEBUG] Tokenizer type: {type(tokenizer)}")
         
         # Ensure image is RGB - TrOCR requires RGB format
         if image.mode != "RGB":
@@ -265,15 +264,15 @@ def extract_text_from_image(
         
         # Process image with TrOCR processor
         # The processor handles normalization and tensor conversion
-        logger.info(f"[DEBUG] Processing image: size={image.size}, mode={image.mode}")
-        logger.info(f"[DEBUG] Processor type: {type(processor)}")
+        logger.debug(f"[DEBUG] Processing image: size={image.size}, mode={image.mode}")
+        logger.debug(f"[DEBUG] Processor type: {type(processor)}")
         try:
             # TrOCR VisionEncoderDecoderProcessor needs images parameter only for inference
             # Check if processor has image_processor attribute
             if hasattr(processor, 'image_processor'):
                 # Use the image processor directly
                 pixel_values = processor.image_processor(image, return_tensors="pt").pixel_values.to(device)
-                logger.info(f"[DEBUG] Used image_processor attribute")
+                logger.debug(f"[DEBUG] Used image_processor attribute")
             else:
                 # Try calling processor with images only (no text parameter)
                 processed = processor(images=image, return_tensors="pt")
@@ -284,7 +283,7 @@ def extract_text_from_image(
                 else:
                     pixel_values = processed.to(device)
             
-            logger.info(f"[DEBUG] Pixel values shape: {pixel_values.shape}")
+            logger.debug(f"[DEBUG] Pixel values shape: {pixel_values.shape}")
         except Exception as e:
             logger.error(f"[ERROR] Image processing failed: {e}", exc_info=True)
             logger.error(f"[ERROR] Processor attributes: {dir(processor)}")
@@ -324,13 +323,13 @@ def extract_text_from_image(
             else:
                 generated_ids = generate_outputs
             
-            logger.info(f"[DEBUG] Generated IDs shape: {generated_ids.shape}")
+            logger.debug(f"[DEBUG] Generated IDs shape: {generated_ids.shape}")
             
             generated_text = processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
             
             # Log the generated text for debugging
-            logger.info(f"[DEBUG] Generated text (raw): {repr(generated_text)}")
-            logger.info(f"[DEBUG] Generated text length: {len(generated_text)}")
+            logger.debug(f"[DEBUG] Generated text (raw): {repr(generated_text)}")
+            logger.debug(f"[DEBUG] Generated text length: {len(generated_text)}")
             
             if len(generated_text.strip()) == 0:
                 logger.warning("[WARNING] Generated text is empty! This could indicate:")
@@ -412,7 +411,7 @@ def _extract_text_trocr_legacy(
     """
     try:
         # Load model
-        logger.info(f"[DEBUG] Loading model type: {model_type}")
+        logger.debug(f"[DEBUG] Loading model type: {model_type}")
         model_data = load_trocr_model(model_type)
         if model_data is None:
             logger.error(f"[ERROR] Model {model_type} failed to load")
@@ -427,12 +426,12 @@ def _extract_text_trocr_legacy(
         device = get_device()
         
         # DEBUG: Check torch and model
-        logger.info(f"[DEBUG] Torch version: {torch.__version__}")
-        logger.info(f"[DEBUG] CUDA available: {torch.cuda.is_available()}")
-        logger.info(f"[DEBUG] Device: {device}")
-        logger.info(f"[DEBUG] Model type: {type(model)}")
-        logger.info(f"[DEBUG] Processor type: {type(processor)}")
-        logger.info(f"[DEBUG] Tokenizer type: {type(tokenizer)}")
+        logger.debug(f"[DEBUG] Torch version: {torch.__version__}")
+        logger.debug(f"[DEBUG] CUDA available: {torch.cuda.is_available()}")
+        logger.debug(f"[DEBUG] Device: {device}")
+        logger.debug(f"[DEBUG] Model type: {type(model)}")
+        logger.debug(f"[DEBUG] Processor type: {type(processor)}")
+        logger.debug(f"[DEBUG] Tokenizer type: {type(tokenizer)}")
         
         # Ensure image is RGB - TrOCR requires RGB format
         if image.mode != "RGB":
@@ -459,15 +458,15 @@ def _extract_text_trocr_legacy(
         
         # Process image with TrOCR processor
         # The processor handles normalization and tensor conversion
-        logger.info(f"[DEBUG] Processing image: size={image.size}, mode={image.mode}")
-        logger.info(f"[DEBUG] Processor type: {type(processor)}")
+        logger.debug(f"[DEBUG] Processing image: size={image.size}, mode={image.mode}")
+        logger.debug(f"[DEBUG] Processor type: {type(processor)}")
         try:
             # TrOCR VisionEncoderDecoderProcessor needs images parameter only for inference
             # Check if processor has image_processor attribute
             if hasattr(processor, 'image_processor'):
                 # Use the image processor directly
                 pixel_values = processor.image_processor(image, return_tensors="pt").pixel_values.to(device)
-                logger.info(f"[DEBUG] Used image_processor attribute")
+                logger.debug(f"[DEBUG] Used image_processor attribute")
             else:
                 # Try calling processor with images only (no text parameter)
                 processed = processor(images=image, return_tensors="pt")
@@ -478,7 +477,7 @@ def _extract_text_trocr_legacy(
                 else:
                     pixel_values = processed.to(device)
             
-            logger.info(f"[DEBUG] Pixel values shape: {pixel_values.shape}")
+            logger.debug(f"[DEBUG] Pixel values shape: {pixel_values.shape}")
         except Exception as e:
             logger.error(f"[ERROR] Image processing failed: {e}", exc_info=True)
             logger.error(f"[ERROR] Processor attributes: {dir(processor)}")
@@ -518,13 +517,13 @@ def _extract_text_trocr_legacy(
             else:
                 generated_ids = generate_outputs
             
-            logger.info(f"[DEBUG] Generated IDs shape: {generated_ids.shape}")
+            logger.debug(f"[DEBUG] Generated IDs shape: {generated_ids.shape}")
             
             generated_text = processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
             
             # Log the generated text for debugging
-            logger.info(f"[DEBUG] Generated text (raw): {repr(generated_text)}")
-            logger.info(f"[DEBUG] Generated text length: {len(generated_text)}")
+            logger.debug(f"[DEBUG] Generated text (raw): {repr(generated_text)}")
+            logger.debug(f"[DEBUG] Generated text length: {len(generated_text)}")
             
             if len(generated_text.strip()) == 0:
                 logger.warning("[WARNING] Generated text is empty! This could indicate:")
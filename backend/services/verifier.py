@@ -4,11 +4,7 @@ Uses rapidfuzz for fast and accurate fuzzy matching.
 """
 
 from typing import Dict, List, Tuple, Optional
-import sys
-import os
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import setup_logger
 
 logger = setup_logger("verifier")
@@ -0,0 +1,55 @@
+"""
+Regression tests for field extraction on Devanagari and Arabic-Indic digits.
+RE2 (used when google-re2 is installed) treats only ASCII digits as digits, so these
+must match the same way with and without it.
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.field_mapper import _compiled_patterns, extract_all_fields
+
+
+def test_phone_patterns_match_non_ascii_digits():
+    labelled, bare = _compiled_patterns['phone']
+    assert labelled.search('फोन: ९८७६५४३२१०') is None  # Hindi label, not an English one
+    assert bare.search('फोन: ९८७६५४३२१०').group(1) == '९८७६५४३२१०'
+    assert bare.search('الهاتف: ٠٥٠١٢٣٤٥٦٧').group(1) == '٠٥٠١٢٣٤٥٦٧'
+    assert labelled.search('Phone: ९८७६५४३२१०').group(1) == '९८७६५४३२१०'
+
+
+
+def test_date_age_pin_aadhaar_patterns_match_non_ascii_digits():
+    labelled_dob = _compiled_patterns['dob_candidates'][0]
+    assert labelled_dob.search('Date of Birth: १२/०५/१९९०').groups() == ('१२', '०५', '१९९०')
+    assert _compiled_patterns['age'][0].search('Age: २५').group(1) == '२५'
+    assert _compiled_patterns['pin'][0].search('Pin Code: ५६०००१').group(1) == '५६०००१'
+    assert _compiled_patterns['pin'][2].search('Address: MG Road ५६०००१').group(1) == '५६०००१'
+    assert _compiled_patterns['aadhaar'][2].search('१२३४ ५६७८ ९०१२').group(1) == '१२३४ ५६७८ ९०१२'
+
+
+
+def test_extract_all_fields_non_ascii_digits():
+    assert extract_all_fields('फोन: ९८७६५४३२१०')['fields'].get('phone') == '९८७६५४३२१०'
+    assert extract_all_fields('الهاتف: ٠٥٠١٢٣٤٥٦٧')['fields'].get('phone') == '٠٥٠١٢٣٤٥٦٧'
+    assert extract_all_fields('Name: Ravi Kumar\n९८७६५४३२१०')['fields'].get('phone') == '९८७६५४३२१०'
+    assert extract_all_fields('Pin Code: ५६०००१')['fields'].get('pin_code') == '५६०००१'
+    fields = extract_all_fields('Date of Birth: १२/०५/१९९०')['fields']
+    assert fields.get('date_of_birth') == '१२०५१९९०'
+    assert fields.get('age')
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
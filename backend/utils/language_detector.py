@@ -6,12 +6,8 @@ Optimized for speed using regex and text sampling.
 
 import re
 from typing import Literal
-import sys
-import os
 
-# Add parent directory to path for utils import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.logger import setup_logger
+from .logger import setup_logger
 
 logger = setup_logger("language_detector")
 